@@ -6,13 +6,40 @@ This module provides functions for common PDF operations including:
 - Text extraction
 - Merging and splitting PDFs
 - Error handling for common PDF issues
+
+Text and metadata extraction use PyMuPDF when it is installed, which is
+considerably faster than pypdf on multi-page documents. pypdf remains
+the backend for all writer paths and the fallback for reads.
 """
 
+import functools
+import io
 import os
-from typing import Dict, List
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Dict, List, Optional, TextIO
 
 from pypdf import PdfReader, PdfWriter
 
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+_TEXT_BACKEND = "pymupdf" if pymupdf is not None else "pypdf"
+
+# Smallest possible PDF is a header, an empty trailer and %%EOF
+_MIN_PDF_SIZE = 67
+_EOF_SEARCH_BYTES = 1024
+
+# Below this much total input, starting worker processes and re-parsing
+# their output costs more than parsing the inputs in parallel saves
+_PARALLEL_MERGE_MIN_BYTES = 32 * 1024 * 1024
+
 
 class PDFOperationError(Exception):
     """Raised when a PDF operation fails."""
@@ -20,10 +47,55 @@ class PDFOperationError(Exception):
     pass
 
 
+def _quick_validate(pdf_path: str) -> None:
+    """
+    Reject files that are clearly not PDFs before running a full parse.
+
+    Checks the file size, the %PDF- header and the %%EOF marker near the
+    end of the file, which costs two small reads instead of a parser
+    that may spend seconds trying to recover a corrupt trailer.
+
+    Raises:
+        PDFOperationError: If the file is empty, truncated or not a PDF
+    """
+    size = os.stat(pdf_path).st_size
+    if size < _MIN_PDF_SIZE:
+        raise PDFOperationError(
+            f"Not a valid PDF: {pdf_path} is too small"
+        )
+
+    with open(pdf_path, "rb") as pdf_file:
+        header = pdf_file.read(5)
+        pdf_file.seek(max(0, size - _EOF_SEARCH_BYTES))
+        tail = pdf_file.read()
+
+    if header != b"%PDF-":
+        raise PDFOperationError(
+            f"Not a valid PDF: {pdf_path} is missing the PDF header"
+        )
+    if b"%%EOF" not in tail:
+        raise PDFOperationError(
+            f"Not a valid PDF: {pdf_path} is truncated"
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _reader_cache(
+    abspath: str, mtime_ns: int, size: int
+) -> PdfReader:
+    """Parse a PDF once per (path, mtime, size) and reuse the reader."""
+    _quick_validate(abspath)
+    return PdfReader(abspath)
+
+
 def read_pdf(pdf_path: str) -> PdfReader:
     """
     Read a PDF file and return a PdfReader object.
 
+    Readers are cached by path, modification time and size, so repeated
+    reads of an unchanged file reuse the parsed document. The returned
+    reader is shared between callers and should not be modified.
+
     Args:
         pdf_path: Path to the PDF file
 
@@ -39,14 +111,83 @@ def read_pdf(pdf_path: str) -> PdfReader:
         )
 
     try:
-        reader = PdfReader(pdf_path)
-        return reader
+        stat = os.stat(pdf_path)
+        return _reader_cache(
+            os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size
+        )
+    except PDFOperationError:
+        raise
+    except Exception as e:
+        raise PDFOperationError(
+            f"Failed to read PDF: {str(e)}"
+        )
+
+
+def _open_pymupdf(pdf_path: str) -> "pymupdf.Document":
+    """
+    Open a PDF file with PyMuPDF.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        pymupdf.Document object (use as a context manager)
+
+    Raises:
+        PDFOperationError: If file not found or cannot be read
+    """
+    if not os.path.exists(pdf_path):
+        raise PDFOperationError(
+            f"PDF file not found: {pdf_path}"
+        )
+
+    try:
+        _quick_validate(pdf_path)
+        return pymupdf.open(pdf_path, filetype="pdf")
+    except PDFOperationError:
+        raise
     except Exception as e:
         raise PDFOperationError(
             f"Failed to read PDF: {str(e)}"
         )
 
 
+def _extract_metadata_pymupdf(pdf_path: str) -> Dict[str, any]:
+    """Extract metadata with PyMuPDF in a single document open."""
+    with _open_pymupdf(pdf_path) as doc:
+        info = doc.metadata or {}
+        return {
+            "pages": doc.page_count,
+            "title": info.get("title") or None,
+            "author": info.get("author") or None,
+            "subject": info.get("subject") or None,
+            "creator": info.get("creator") or None,
+        }
+
+
+def _extract_text_pymupdf(pdf_path: str) -> str:
+    """Extract text from all pages with PyMuPDF, preserving order."""
+    with _open_pymupdf(pdf_path) as doc:
+        return "\n".join(
+            page.get_text("text") for page in doc
+        ).strip()
+
+
+def _extract_page_text_pymupdf(pdf_path: str, page_number: int) -> str:
+    """
+    Extract text from one page with PyMuPDF.
+
+    Only the requested page's content stream and the resources it
+    references are loaded; other pages are never dereferenced.
+    """
+    with _open_pymupdf(pdf_path) as doc:
+        if page_number < 1 or page_number > doc.page_count:
+            raise PDFOperationError(
+                f"Invalid page number: {page_number}"
+            )
+        return doc.load_page(page_number - 1).get_text("text")
+
+
 def extract_metadata(pdf_path: str) -> Dict[str, any]:
     """
     Extract metadata from a PDF file.
@@ -60,6 +201,9 @@ def extract_metadata(pdf_path: str) -> Dict[str, any]:
     Raises:
         PDFOperationError: If file cannot be read
     """
+    if _TEXT_BACKEND == "pymupdf":
+        return _extract_metadata_pymupdf(pdf_path)
+
     reader = read_pdf(pdf_path)
 
     metadata = {
@@ -94,6 +238,11 @@ def extract_text(pdf_path: str, page_number: int = None) -> str:
     Raises:
         PDFOperationError: If file cannot be read or page invalid
     """
+    if _TEXT_BACKEND == "pymupdf":
+        if page_number is not None:
+            return _extract_page_text_pymupdf(pdf_path, page_number)
+        return _extract_text_pymupdf(pdf_path)
+
     reader = read_pdf(pdf_path)
 
     if page_number is not None:
@@ -103,20 +252,82 @@ def extract_text(pdf_path: str, page_number: int = None) -> str:
             )
         return reader.pages[page_number - 1].extract_text()
 
-    text = ""
+    parts = [page.extract_text() for page in reader.pages]
+    return "\n".join(parts).strip()
+
+
+def extract_text_to(pdf_path: str, out: TextIO) -> None:
+    """
+    Stream text from every page of a PDF to a writable text sink.
+
+    Pages are written one at a time, so peak memory stays at a single
+    page of text regardless of document length.
+
+    Args:
+        pdf_path: Path to the PDF file
+        out: Text stream to write to (e.g., an open file)
+
+    Raises:
+        PDFOperationError: If file cannot be read
+    """
+    if _TEXT_BACKEND == "pymupdf":
+        with _open_pymupdf(pdf_path) as doc:
+            for page in doc:
+                out.write(page.get_text("text"))
+                out.write("\n")
+        return
+
+    reader = read_pdf(pdf_path)
     for page in reader.pages:
-        text += page.extract_text() + "\n"
+        out.write(page.extract_text())
+        out.write("\n")
+
+
+def _serialize_pages(pdf_path: str) -> bytes:
+    """
+    Parse a PDF and return its pages re-serialized as PDF bytes.
+
+    Runs in a worker process for merge_pdfs, so the expensive parse
+    happens off the main process and only bytes cross the boundary.
+    """
+    reader = read_pdf(pdf_path)
+    writer = PdfWriter()
+    writer.append_pages_from_reader(reader)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
 
-    return text.strip()
+def _total_size(paths: Dict[str, str]) -> int:
+    """Sum the sizes of existing files; read_pdf reports missing ones."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.stat(path).st_size
+        except OSError:
+            pass
+    return total
 
 
-def merge_pdfs(pdf_paths: List[str], output_path: str) -> None:
+def merge_pdfs(
+    pdf_paths: List[str],
+    output_path: str,
+    max_workers: Optional[int] = None,
+) -> None:
     """
     Merge multiple PDF files into a single PDF.
 
+    Each distinct input is parsed once; pages are appended to the
+    output in input order, including repeated inputs. When there are
+    two or more distinct inputs totalling at least 32MB and more than
+    one worker is available, they are parsed in parallel worker
+    processes.
+
     Args:
         pdf_paths: List of paths to PDF files to merge
         output_path: Path where merged PDF will be saved
+        max_workers: Number of worker processes (default: CPU count,
+                     capped at 4)
 
     Raises:
         PDFOperationError: If input list empty or files cannot be read
@@ -126,12 +337,39 @@ def merge_pdfs(pdf_paths: List[str], output_path: str) -> None:
             "Cannot merge empty list of PDFs"
         )
 
+    # Parse each distinct file once, even if it is listed repeatedly
+    unique_paths = {}
+    for pdf_path in pdf_paths:
+        unique_paths.setdefault(os.path.abspath(pdf_path), pdf_path)
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, 4)
+
+    if (
+        len(unique_paths) < 2
+        or max_workers < 2
+        or _total_size(unique_paths) < _PARALLEL_MERGE_MIN_BYTES
+    ):
+        readers = {
+            key: read_pdf(pdf_path)
+            for key, pdf_path in unique_paths.items()
+        }
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            serialized = executor.map(
+                _serialize_pages, unique_paths.values()
+            )
+            readers = {
+                key: PdfReader(io.BytesIO(data))
+                for key, data in zip(unique_paths, serialized)
+            }
+
     writer = PdfWriter()
 
     for pdf_path in pdf_paths:
-        reader = read_pdf(pdf_path)
-        for page in reader.pages:
-            writer.add_page(page)
+        writer.append_pages_from_reader(
+            readers[os.path.abspath(pdf_path)]
+        )
 
     try:
         with open(output_path, "wb") as output_file:
@@ -140,15 +378,35 @@ def merge_pdfs(pdf_paths: List[str], output_path: str) -> None:
         raise PDFOperationError(
             f"Failed to write merged PDF: {str(e)}"
         )
+    finally:
+        _reader_cache.cache_clear()
+
+
+def _write_pdf(writer: PdfWriter, output_path: str) -> str:
+    """Write a PdfWriter to disk and return the output path."""
+    with open(output_path, "wb") as output_file:
+        writer.write(output_file)
+    return output_path
 
 
-def split_pdf(pdf_path: str, output_dir: str) -> List[str]:
+def split_pdf(
+    pdf_path: str,
+    output_dir: str,
+    max_workers: Optional[int] = None,
+) -> List[str]:
     """
     Split a PDF into individual pages.
 
+    Pages are copied from the source on the calling thread (the reader
+    is not thread-safe) and each per-page file is handed to a thread
+    pool as soon as it is built. At most twice max_workers pages are
+    in flight, so memory stays bounded regardless of page count.
+
     Args:
         pdf_path: Path to the PDF file to split
         output_dir: Directory where split PDFs will be saved
+        max_workers: Number of writer threads (default: CPU count,
+                     capped at 8)
 
     Returns:
         List of paths to the created PDF files
@@ -167,26 +425,43 @@ def split_pdf(pdf_path: str, output_dir: str) -> List[str]:
         )
 
     reader = read_pdf(pdf_path)
-    output_files = []
 
     base_name = os.path.splitext(
         os.path.basename(pdf_path)
     )[0]
 
-    for i, page in enumerate(reader.pages, 1):
-        writer = PdfWriter()
-        writer.add_page(page)
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    max_in_flight = 2 * max_workers
+
+    output_files = [None] * len(reader.pages)
+    pending = {}
+
+    def collect(done):
+        for future in done:
+            i = pending.pop(future)
+            try:
+                output_files[i - 1] = future.result()
+            except Exception as e:
+                raise PDFOperationError(
+                    f"Failed to write page {i}: {str(e)}"
+                )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i, page in enumerate(reader.pages, 1):
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            writer = PdfWriter()
+            writer.add_page(page)
 
-        output_path = os.path.join(
-            output_dir, f"{base_name}_page_{i}.pdf"
-        )
-        try:
-            with open(output_path, "wb") as output_file:
-                writer.write(output_file)
-            output_files.append(output_path)
-        except Exception as e:
-            raise PDFOperationError(
-                f"Failed to write page {i}: {str(e)}"
+            output_path = os.path.join(
+                output_dir, f"{base_name}_page_{i}.pdf"
             )
+            pending[executor.submit(_write_pdf, writer, output_path)] = i
+
+        collect(wait(pending).done)
 
+    _reader_cache.cache_clear()
     return output_files
@@ -1,17 +1,22 @@
+import io
 import os
+import shutil
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(
     0, str(Path(__file__).parent.parent / "scripts")
 )
 
+import pdf_operations
 from pdf_operations import (
     read_pdf,
     extract_metadata,
     extract_text,
+    extract_text_to,
     merge_pdfs,
     split_pdf,
     PDFOperationError,
@@ -28,8 +33,6 @@ class TestPDFBasicOperations(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures after each test method."""
-        import shutil
-
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
 
@@ -52,12 +55,46 @@ class TestPDFBasicOperations(unittest.TestCase):
         self.assertIsNotNone(reader)
         self.assertEqual(len(reader.pages), 2)
 
+    def test_read_pdf_reuses_cached_reader(self):
+        """Test repeated reads of an unchanged file share one reader."""
+        first = read_pdf(self.sample_pdf)
+        second = read_pdf(self.sample_pdf)
+        self.assertIs(first, second)
+
     def test_read_pdf_file_not_found(self):
         """Test reading a non-existent PDF file."""
         with self.assertRaises(PDFOperationError) as context:
             read_pdf("nonexistent.pdf")
         self.assertIn("not found", str(context.exception).lower())
 
+    def test_read_pdf_not_a_pdf(self):
+        """Test reading a file that is not a PDF."""
+        bogus_path = os.path.join(self.test_dir, "bogus.pdf")
+        with open(bogus_path, "w") as bogus_file:
+            bogus_file.write("this is not a pdf " * 10)
+
+        with self.assertRaises(PDFOperationError) as context:
+            read_pdf(bogus_path)
+        self.assertIn("not a valid pdf", str(context.exception).lower())
+
+    def test_read_directory_wrapped(self):
+        """Test OS errors from a directory path are wrapped."""
+        backends = ["pypdf"]
+        if pdf_operations.pymupdf is not None:
+            backends.append("pymupdf")
+
+        for backend in backends:
+            with mock.patch.object(
+                pdf_operations, "_TEXT_BACKEND", backend
+            ):
+                for operation in (extract_text, extract_metadata):
+                    with self.assertRaises(PDFOperationError) as context:
+                        operation(self.test_dir)
+                    self.assertIn(
+                        "failed to read pdf",
+                        str(context.exception).lower()
+                    )
+
     def test_extract_metadata_success(self):
         """Test extracting metadata from a PDF."""
         metadata = extract_metadata(self.sample_pdf)
@@ -78,6 +115,37 @@ class TestPDFBasicOperations(unittest.TestCase):
         self.assertIn("Test Page 1", text)
         self.assertNotIn("Test Page 2", text)
 
+    def test_extract_text_invalid_page(self):
+        """Test extracting text from an out-of-range page."""
+        backends = ["pypdf"]
+        if pdf_operations.pymupdf is not None:
+            backends.append("pymupdf")
+
+        for backend in backends:
+            with mock.patch.object(
+                pdf_operations, "_TEXT_BACKEND", backend
+            ):
+                with self.assertRaises(PDFOperationError) as context:
+                    extract_text(self.sample_pdf, page_number=3)
+                self.assertIn("invalid", str(context.exception).lower())
+
+    def test_extract_text_to_stream(self):
+        """Test streaming extracted text to a file-like sink."""
+        out = io.StringIO()
+        extract_text_to(self.sample_pdf, out)
+        text = out.getvalue()
+        self.assertIn("Test Page 1", text)
+        self.assertIn("Test Page 2", text)
+
+    def test_extract_text_pypdf_fallback(self):
+        """Test text extraction when PyMuPDF is unavailable."""
+        with mock.patch.object(pdf_operations, "_TEXT_BACKEND", "pypdf"):
+            text = extract_text(self.sample_pdf)
+            metadata = extract_metadata(self.sample_pdf)
+        self.assertIn("Test Page 1", text)
+        self.assertIn("Test Page 2", text)
+        self.assertEqual(metadata["pages"], 2)
+
     def test_merge_pdfs_success(self):
         """Test merging multiple PDF files."""
         pdf2_path = os.path.join(self.test_dir, "sample2.pdf")
@@ -95,6 +163,55 @@ class TestPDFBasicOperations(unittest.TestCase):
         reader = read_pdf(output_path)
         self.assertEqual(len(reader.pages), 3)
 
+    def test_merge_pdfs_repeated_input(self):
+        """Test merging a PDF listed more than once."""
+        output_path = os.path.join(self.test_dir, "merged.pdf")
+        merge_pdfs([self.sample_pdf, self.sample_pdf], output_path)
+
+        reader = read_pdf(output_path)
+        self.assertEqual(len(reader.pages), 4)
+
+    def test_merge_pdfs_small_inputs_skip_process_pool(self):
+        """Test small merges are parsed in-process."""
+        output_path = os.path.join(self.test_dir, "merged.pdf")
+        copy_path = os.path.join(self.test_dir, "copy.pdf")
+        shutil.copy(self.sample_pdf, copy_path)
+
+        with mock.patch.object(
+            pdf_operations, "ProcessPoolExecutor"
+        ) as pool:
+            merge_pdfs([self.sample_pdf, copy_path], output_path, 2)
+
+        pool.assert_not_called()
+        self.assertEqual(len(read_pdf(output_path).pages), 4)
+
+    def test_merge_pdfs_large_inputs_use_process_pool(self):
+        """Test inputs above the size threshold are parsed in workers."""
+        output_path = os.path.join(self.test_dir, "merged.pdf")
+        copy_path = os.path.join(self.test_dir, "copy.pdf")
+        shutil.copy(self.sample_pdf, copy_path)
+
+        with mock.patch.object(
+            pdf_operations, "_PARALLEL_MERGE_MIN_BYTES", 0
+        ), mock.patch.object(
+            pdf_operations,
+            "ProcessPoolExecutor",
+            wraps=pdf_operations.ProcessPoolExecutor,
+        ) as pool:
+            merge_pdfs([self.sample_pdf, copy_path], output_path, 2)
+
+        pool.assert_called_once_with(max_workers=2)
+        self.assertEqual(len(read_pdf(output_path).pages), 4)
+
+    def test_merge_pdfs_missing_input(self):
+        """Test merging reports a missing input."""
+        output_path = os.path.join(self.test_dir, "merged.pdf")
+        with self.assertRaises(PDFOperationError) as context:
+            merge_pdfs(
+                [self.sample_pdf, "nonexistent.pdf"], output_path
+            )
+        self.assertIn("not found", str(context.exception).lower())
+
     def test_merge_pdfs_empty_list(self):
         """Test merging with empty list of PDFs."""
         output_path = os.path.join(self.test_dir, "merged.pdf")
@@ -118,6 +235,44 @@ class TestPDFBasicOperations(unittest.TestCase):
             reader = read_pdf(file_path)
             self.assertEqual(len(reader.pages), 1)
 
+    def test_split_pdf_bounds_pages_in_flight(self):
+        """Test split keeps at most 2 * max_workers pages in memory."""
+        from reportlab.pdfgen import canvas
+
+        pdf_path = os.path.join(self.test_dir, "long.pdf")
+        c = canvas.Canvas(pdf_path)
+        for page in range(10):
+            c.drawString(100, 750, f"Page {page + 1}")
+            c.showPage()
+        c.save()
+
+        output_dir = os.path.join(self.test_dir, "split")
+        os.makedirs(output_dir)
+
+        counts = {"built": 0, "written": 0, "peak": 0}
+        real_writer = pdf_operations.PdfWriter
+        real_write = pdf_operations._write_pdf
+
+        def build_writer():
+            counts["built"] += 1
+            return real_writer()
+
+        def write(writer, output_path):
+            in_flight = counts["built"] - counts["written"]
+            counts["peak"] = max(counts["peak"], in_flight)
+            result = real_write(writer, output_path)
+            counts["written"] += 1
+            return result
+
+        with mock.patch.object(
+            pdf_operations, "PdfWriter", side_effect=build_writer
+        ), mock.patch.object(pdf_operations, "_write_pdf", write):
+            files = split_pdf(pdf_path, output_dir, max_workers=1)
+
+        self.assertEqual(len(files), 10)
+        self.assertLessEqual(counts["peak"], 2)
+        self.assertIn("Page 7", extract_text(files[6]))
+
     def test_split_pdf_invalid_output_dir(self):
         """Test splitting PDF with invalid output directory."""
         with self.assertRaises(PDFOperationError) as context:
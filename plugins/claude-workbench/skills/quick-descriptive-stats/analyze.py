@@ -5,10 +5,18 @@ This module provides functions to automatically analyze CSV files and
 generate comprehensive statistical insights with visualizations.
 """
 
+import csv
+import datetime
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from pandas.api import types as ptypes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
 
 
@@ -16,15 +24,131 @@ import seaborn as sns
 DEFAULT_BINS: int = 30
 DEFAULT_DPI: int = 150
 MAX_CATEGORIES_DISPLAY: int = 10
+MAX_UNIQUE_RATIO: float = 0.9
 MAX_CATEGORICAL_PLOTS: int = 4
 MAX_NUMERIC_PLOTS: int = 4
 MAX_TIMESERIES_PLOTS: int = 3
+MAX_PLOT_WORKERS: int = 4
+MAX_TIMESERIES_POINTS: int = 2000
+STREAMING_CHUNKSIZE: int = 200_000
+
+# Resample frequencies for long time series, finest first, each paired
+# with the shortest bin it can produce
+TIMESERIES_FREQUENCIES: Tuple[Tuple[str, str], ...] = (
+    ("s", "1s"),
+    ("min", "1min"),
+    ("h", "1h"),
+    ("D", "1D"),
+    ("W", "7D"),
+    ("MS", "28D"),
+    ("YS", "365D"),
+)
+
+
+@dataclass(frozen=True)
+class ColumnIndex:
+    """
+    Column names grouped by dtype, computed once per DataFrame.
+
+    Attributes:
+        numeric: Columns matching select_dtypes(include="number")
+        categorical: Object-dtype columns
+        datetime_like: datetime64 columns (tz-aware or naive)
+    """
+
+    numeric: List[str]
+    categorical: List[str]
+    datetime_like: List[str]
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "ColumnIndex":
+        """
+        Classify columns in a single pass over the DataFrame dtypes.
+
+        Args:
+            df: DataFrame to classify
+
+        Returns:
+            ColumnIndex for the DataFrame's columns
+        """
+        numeric, categorical, datetime_like = [], [], []
+        for col, dtype in df.dtypes.items():
+            if ptypes.is_timedelta64_dtype(dtype) or (
+                ptypes.is_numeric_dtype(dtype)
+                and not ptypes.is_bool_dtype(dtype)
+            ):
+                numeric.append(col)
+            elif ptypes.is_object_dtype(dtype):
+                categorical.append(col)
+            elif ptypes.is_datetime64_any_dtype(dtype):
+                datetime_like.append(col)
+        return cls(numeric, categorical, datetime_like)
+
+
+def _check_csv_file(file_path: str) -> None:
+    """
+    Verify a CSV file exists and is not empty.
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV file is empty
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+    if path.stat().st_size == 0:
+        raise ValueError("CSV file is empty")
+
+
+def _header_needs_renaming(file_path: str) -> bool:
+    """Check whether the header has duplicate or blank column names."""
+    try:
+        with open(file_path, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), [])
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return True
+    return len(set(header)) != len(header) or not all(header)
+
+
+def _read_csv_pyarrow(file_path: str) -> pd.DataFrame:
+    """
+    Read a CSV with the pyarrow engine, keeping dates as text.
+
+    pyarrow infers timestamps, dates and times where the C parser keeps
+    the original strings, so any such column is read again as text.
+    """
+    df = pd.read_csv(file_path, engine="pyarrow")
+
+    temporal = []
+    for col in df.columns:
+        values = df[col].dropna()
+        if ptypes.is_datetime64_any_dtype(values) or (
+            len(values)
+            and isinstance(values.iloc[0], (datetime.date, datetime.time))
+        ):
+            temporal.append(col)
+
+    if temporal:
+        df = pd.read_csv(
+            file_path,
+            engine="pyarrow",
+            dtype={col: str for col in temporal}
+        )
+    return df
 
 
 def load_csv(file_path: str) -> pd.DataFrame:
     """
     Load CSV file with error handling and validation.
 
+    Uses pandas' multithreaded pyarrow parser when pyarrow is installed,
+    falling back to the default C parser if pyarrow is missing, rejects
+    the file (e.g., ragged rows), or the header has duplicate or blank
+    names that only the C parser renames ("a.1", "Unnamed: 0"). Date
+    and time columns load as strings with either parser.
+
     Args:
         file_path: Path to CSV file
 
@@ -35,16 +159,16 @@ def load_csv(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV file is empty or cannot be parsed
     """
-    path = Path(file_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"CSV file not found: {file_path}")
-
-    if path.stat().st_size == 0:
-        raise ValueError("CSV file is empty")
+    _check_csv_file(file_path)
 
     try:
-        df = pd.read_csv(file_path)
+        if _header_needs_renaming(file_path):
+            df = pd.read_csv(file_path)
+        else:
+            try:
+                df = _read_csv_pyarrow(file_path)
+            except (ImportError, ValueError):
+                df = pd.read_csv(file_path)
     except pd.errors.EmptyDataError:
         raise ValueError("CSV file is empty")
     except Exception as e:
@@ -67,21 +191,28 @@ def analyze_data_quality(df: pd.DataFrame) -> Dict[str, any]:
         - is_complete: True if no missing values
         - missing_by_column: Dict of columns with missing values
     """
-    total_cells = df.shape[0] * df.shape[1]
-    total_missing = df.isnull().sum().sum()
+    return _quality_from_null_counts(df.isna().sum(), len(df))
+
+
+def _quality_from_null_counts(
+    null_counts: pd.Series,
+    n_rows: int
+) -> Dict[str, any]:
+    """Build the analyze_data_quality result from per-column null counts."""
+    total_cells = n_rows * len(null_counts)
+    total_missing = int(null_counts.sum())
     missing_percentage = (
         (total_missing / total_cells * 100) if total_cells > 0 else 0.0
     )
 
-    missing_by_column = {}
-    for col in df.columns:
-        col_missing = df[col].isnull().sum()
-        if col_missing > 0:
-            col_pct = (col_missing / len(df)) * 100
-            missing_by_column[col] = {
-                "count": int(col_missing),
-                "percentage": round(col_pct, 1)
-            }
+    cols_with_missing = null_counts[null_counts > 0]
+    col_pcts = (cols_with_missing / n_rows * 100).round(1)
+    missing_by_column = {
+        col: {"count": int(count), "percentage": float(pct)}
+        for col, count, pct in zip(
+            cols_with_missing.index, cols_with_missing, col_pcts
+        )
+    }
 
     return {
         "total_missing": int(total_missing),
@@ -91,55 +222,225 @@ def analyze_data_quality(df: pd.DataFrame) -> Dict[str, any]:
     }
 
 
-def compute_statistics(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+def compute_statistics(
+    df: pd.DataFrame,
+    columns: Optional[ColumnIndex] = None
+) -> Dict[str, Dict[str, float]]:
     """
     Compute summary statistics for numeric columns.
 
     Args:
         df: DataFrame to analyze
+        columns: Precomputed column classification (built if omitted)
 
     Returns:
         Dictionary mapping column names to statistics
         (mean, std, min, 25%, 50%, 75%, max)
     """
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+    if columns is None:
+        columns = ColumnIndex.from_dataframe(df)
+
+    numeric_cols = columns.numeric
 
     if not numeric_cols:
         return {}
 
-    stats = {}
-    for col in numeric_cols:
-        desc = df[col].describe()
-        stats[col] = {
-            "mean": round(desc["mean"], 2),
-            "std": round(desc["std"], 2),
-            "min": round(desc["min"], 2),
-            "25%": round(desc["25%"], 2),
-            "50%": round(desc["50%"], 2),
-            "75%": round(desc["75%"], 2),
-            "max": round(desc["max"], 2)
+    desc = df[numeric_cols].describe().round(2)
+    stat_names = ["mean", "std", "min", "25%", "50%", "75%", "max"]
+
+    return {
+        col: {name: desc.at[name, col] for name in stat_names}
+        for col in numeric_cols
+    }
+
+
+class _RunningStats:
+    """Mergeable count/mean/variance/min/max (Chan et al. update)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray) -> None:
+        """Fold a batch of non-missing float values into the totals."""
+        n_b = values.size
+        if n_b == 0:
+            return
+
+        mean_b = values.mean()
+        m2_b = ((values - mean_b) ** 2).sum()
+        n = self.count + n_b
+        delta = mean_b - self.mean
+
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta ** 2 * self.count * n_b / n
+        self.count = n
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    def as_statistics(self) -> Dict[str, float]:
+        """Return rounded mean, std, min and max like compute_statistics."""
+        if self.count == 0:
+            return {key: np.nan for key in ("mean", "std", "min", "max")}
+
+        std = (
+            np.sqrt(self.m2 / (self.count - 1))
+            if self.count > 1 else np.nan
+        )
+        return {
+            "mean": round(np.float64(self.mean), 2),
+            "std": round(np.float64(std), 2),
+            "min": round(np.float64(self.min), 2),
+            "max": round(np.float64(self.max), 2)
         }
 
-    return stats
+
+def _merge_dtypes(current: Optional[np.dtype], new: np.dtype) -> np.dtype:
+    """Widen a column dtype seen in one chunk with the next chunk's dtype."""
+    if current is None or current == new:
+        return new
+
+    both_numeric = all(
+        ptypes.is_numeric_dtype(d) and not ptypes.is_bool_dtype(d)
+        for d in (current, new)
+    )
+    return np.dtype("float64") if both_numeric else np.dtype("object")
+
+
+def stream_csv_summary(
+    file_path: str,
+    chunksize: Optional[int] = None
+) -> Tuple[pd.DataFrame, int, Dict[str, any], Dict[str, Dict[str, float]]]:
+    """
+    Compute overview, data quality and numeric statistics chunk by chunk.
+
+    Peak memory is bounded by the chunk size rather than the file size.
+    Quantiles need the full data, so the statistics contain only mean,
+    std, min and max.
+
+    Args:
+        file_path: Path to CSV file
+        chunksize: Rows per chunk (default: STREAMING_CHUNKSIZE)
+
+    Returns:
+        Tuple of (schema, row count, quality, statistics) where schema is
+        an empty DataFrame with the file's columns and dtypes
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV file is empty or cannot be parsed
+    """
+    _check_csv_file(file_path)
+
+    n_rows = 0
+    null_counts = None
+    dtypes: Dict[str, np.dtype] = {}
+    running: Dict[str, _RunningStats] = {}
+
+    try:
+        reader = pd.read_csv(
+            file_path,
+            chunksize=chunksize or STREAMING_CHUNKSIZE,
+            engine="c"
+        )
+        for chunk in reader:
+            n_rows += len(chunk)
+
+            chunk_nulls = chunk.isna().sum()
+            null_counts = (
+                chunk_nulls if null_counts is None
+                else null_counts.add(chunk_nulls, fill_value=0)
+            )
+
+            for col, dtype in chunk.dtypes.items():
+                dtypes[col] = _merge_dtypes(dtypes.get(col), dtype)
+
+            for col in ColumnIndex.from_dataframe(chunk).numeric:
+                values = chunk[col].to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                )
+                running.setdefault(col, _RunningStats()).update(
+                    values[~np.isnan(values)]
+                )
+    except pd.errors.EmptyDataError:
+        raise ValueError("CSV file is empty")
+    except Exception as e:
+        raise ValueError(f"Failed to parse CSV file: {e}")
+
+    schema = pd.DataFrame(
+        {col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()}
+    )
+    if null_counts is None:
+        null_counts = pd.Series(0, index=schema.columns)
+
+    # A column that turned non-numeric in a later chunk is not numeric
+    stats = {
+        col: running[col].as_statistics()
+        for col in ColumnIndex.from_dataframe(schema).numeric
+        if col in running
+    }
+
+    quality = _quality_from_null_counts(
+        null_counts.astype("int64"), n_rows
+    )
+    return schema, n_rows, quality, stats
 
 
-def analyze_correlations(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+def analyze_correlations(
+    df: pd.DataFrame,
+    columns: Optional[ColumnIndex] = None
+) -> Optional[pd.DataFrame]:
     """
     Compute correlation matrix for numeric columns.
 
     Args:
         df: DataFrame to analyze
+        columns: Precomputed column classification (built if omitted)
 
     Returns:
         Correlation matrix if multiple numeric columns exist,
         None otherwise
     """
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+    if columns is None:
+        columns = ColumnIndex.from_dataframe(df)
+
+    numeric_cols = columns.numeric
 
     if len(numeric_cols) < 2:
         return None
 
-    return df[numeric_cols].corr()
+    values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Missing values need pandas' pairwise-complete handling; otherwise
+    # a single corrcoef over the dense matrix gives the same result
+    if len(values) < 2 or np.isnan(values).any():
+        return df[numeric_cols].corr()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(values, rowvar=False)
+
+    return pd.DataFrame(corr, index=numeric_cols, columns=numeric_cols)
+
+
+def _new_figure(figsize: Tuple[float, float]) -> Figure:
+    """
+    Create a Figure rendered directly by an Agg canvas.
+
+    Skips pyplot's global figure manager, so figures are not registered,
+    need no plt.close(), and can be drawn from worker threads.
+
+    Args:
+        figsize: Figure size in inches (width, height)
+
+    Returns:
+        Figure attached to a FigureCanvasAgg
+    """
+    fig = Figure(figsize=figsize, dpi=DEFAULT_DPI)
+    FigureCanvasAgg(fig)
+    return fig
 
 
 def create_correlation_heatmap(
@@ -153,24 +454,50 @@ def create_correlation_heatmap(
         corr_matrix: Correlation matrix DataFrame
         output_path: Path to save visualization
     """
-    plt.figure(figsize=(10, 8))
+    fig = _new_figure((10, 8))
+    ax = fig.subplots()
     sns.heatmap(
         corr_matrix,
+        ax=ax,
         annot=True,
         cmap="coolwarm",
         center=0,
         square=True,
         linewidths=1
     )
-    plt.title("Correlation Heatmap")
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DEFAULT_DPI)
-    plt.close()
+    ax.set_title("Correlation Heatmap")
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=DEFAULT_DPI)
+
+
+def _downsample_timeseries(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average a time-indexed frame into at most MAX_TIMESERIES_POINTS bins.
+
+    Long series add line segments without adding visible detail, so the
+    series is resampled to the finest standard calendar frequency whose
+    bins over the index's time span fit the limit.
+
+    Args:
+        frame: DataFrame with a sorted DatetimeIndex
+
+    Returns:
+        The frame itself if short enough, otherwise its binned means
+    """
+    if len(frame) <= MAX_TIMESERIES_POINTS:
+        return frame
+
+    span = frame.index.max() - frame.index.min()
+    for alias, width in TIMESERIES_FREQUENCIES:
+        if span / pd.Timedelta(width) < MAX_TIMESERIES_POINTS - 1:
+            break
+    return frame.resample(alias).mean()
 
 
 def create_time_series_plots(
     df: pd.DataFrame,
-    output_dir: str
+    output_dir: str,
+    columns: Optional[ColumnIndex] = None
 ) -> List[str]:
     """
     Generate time-series visualizations if date columns exist.
@@ -178,6 +505,7 @@ def create_time_series_plots(
     Args:
         df: DataFrame to visualize
         output_dir: Directory for output files
+        columns: Precomputed column classification (built if omitted)
 
     Returns:
         List of paths to created visualizations
@@ -190,46 +518,49 @@ def create_time_series_plots(
     if not date_cols:
         return []
 
+    # Convert only the date column rather than copying the whole frame
     date_col = date_cols[0]
-    df_copy = df.copy()
-    df_copy[date_col] = pd.to_datetime(df_copy[date_col], errors="coerce")
+    dates = pd.to_datetime(df[date_col], errors="coerce")
 
-    numeric_cols = (
-        df_copy.select_dtypes(include="number").columns.tolist()
-    )
+    if columns is None:
+        columns = ColumnIndex.from_dataframe(df)
+
+    numeric_cols = [c for c in columns.numeric if c != date_col]
     if not numeric_cols:
         return []
 
     output_path = f"{output_dir}/time_series_analysis.png"
     n_plots = min(MAX_TIMESERIES_PLOTS, len(numeric_cols))
 
-    fig, axes = plt.subplots(n_plots, 1, figsize=(12, 4 * n_plots))
+    fig = _new_figure((12, 4 * n_plots))
+    axes = fig.subplots(n_plots, 1)
     if n_plots == 1:
         axes = [axes]
 
-    for idx, num_col in enumerate(numeric_cols[:n_plots]):
+    # Build the group index once for every plotted column
+    daily_means = df[numeric_cols[:n_plots]].groupby(dates).mean()
+
+    daily_means = _downsample_timeseries(daily_means)
+
+    for idx, num_col in enumerate(daily_means.columns):
         ax = axes[idx]
-        daily_data = (
-            df_copy.groupby(date_col)[num_col]
-            .agg(["mean", "sum", "count"])
-        )
-        daily_data["mean"].plot(ax=ax, label="Average", linewidth=2)
+        daily_means[num_col].plot(ax=ax, label="Average", linewidth=2)
         ax.set_title(f"{num_col} Over Time")
         ax.set_xlabel("Date")
         ax.set_ylabel(num_col)
         ax.legend()
         ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DEFAULT_DPI)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=DEFAULT_DPI)
 
     return [output_path]
 
 
 def create_distribution_plots(
     df: pd.DataFrame,
-    output_dir: str
+    output_dir: str,
+    columns: Optional[ColumnIndex] = None
 ) -> List[str]:
     """
     Generate distribution histograms for numeric columns.
@@ -237,11 +568,15 @@ def create_distribution_plots(
     Args:
         df: DataFrame to visualize
         output_dir: Directory for output files
+        columns: Precomputed column classification (built if omitted)
 
     Returns:
         List of paths to created visualizations
     """
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
+    if columns is None:
+        columns = ColumnIndex.from_dataframe(df)
+
+    numeric_cols = columns.numeric
 
     if not numeric_cols:
         return []
@@ -249,13 +584,26 @@ def create_distribution_plots(
     output_path = f"{output_dir}/distributions.png"
     n_cols = min(MAX_NUMERIC_PLOTS, len(numeric_cols))
 
-    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    fig = _new_figure((12, 10))
+    axes = fig.subplots(2, 2)
     axes = axes.flatten()
 
-    for idx, col in enumerate(numeric_cols[:n_cols]):
-        axes[idx].hist(
-            df[col].dropna(),
-            bins=DEFAULT_BINS,
+    # Convert the plotted columns to one float block and build the
+    # missing-value mask once, instead of a dropna() per column
+    plot_cols = numeric_cols[:n_cols]
+    values = df[plot_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+
+    for idx, col in enumerate(plot_cols):
+        # Bin in numpy and draw the bars directly, so only the bin
+        # counts (not every row) pass through matplotlib
+        col_values = values[present[:, idx], idx]
+        counts, edges = np.histogram(col_values, bins=DEFAULT_BINS)
+        axes[idx].bar(
+            edges[:-1],
+            counts,
+            width=np.diff(edges),
+            align="edge",
             edgecolor="black",
             alpha=0.7
         )
@@ -268,16 +616,16 @@ def create_distribution_plots(
     for idx in range(n_cols, 4):
         axes[idx].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DEFAULT_DPI)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=DEFAULT_DPI)
 
     return [output_path]
 
 
 def create_categorical_plots(
     df: pd.DataFrame,
-    output_dir: str
+    output_dir: str,
+    columns: Optional[ColumnIndex] = None
 ) -> List[str]:
     """
     Generate categorical distribution bar charts.
@@ -285,31 +633,50 @@ def create_categorical_plots(
     Args:
         df: DataFrame to visualize
         output_dir: Directory for output files
+        columns: Precomputed column classification (built if omitted)
 
     Returns:
         List of paths to created visualizations
     """
-    categorical_cols = (
-        df.select_dtypes(include=["object"]).columns.tolist()
-    )
+    if columns is None:
+        columns = ColumnIndex.from_dataframe(df)
+
     categorical_cols = [
-        c for c in categorical_cols if "id" not in c.lower()
+        c for c in columns.categorical if "id" not in c.lower()
     ]
 
-    if not categorical_cols:
+    # Count over integer category codes rather than hashing strings
+    top_values = []
+    for col in categorical_cols:
+        cat = df[col].astype("category")
+        n_categories = len(cat.cat.categories)
+
+        # Near-unique columns are free text or identifiers
+        if n_categories > len(df) * MAX_UNIQUE_RATIO:
+            continue
+
+        codes = cat.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=n_categories)
+        top = np.argsort(-counts, kind="stable")[:MAX_CATEGORIES_DISPLAY]
+        top_values.append((col, cat.cat.categories[top], counts[top]))
+
+        if len(top_values) == MAX_CATEGORICAL_PLOTS:
+            break
+
+    if not top_values:
         return []
 
     output_path = f"{output_dir}/categorical_distributions.png"
-    n_cols = min(MAX_CATEGORICAL_PLOTS, len(categorical_cols))
+    n_cols = len(top_values)
 
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig = _new_figure((14, 10))
+    axes = fig.subplots(2, 2)
     axes = axes.flatten()
 
-    for idx, col in enumerate(categorical_cols[:n_cols]):
-        value_counts = df[col].value_counts().head(MAX_CATEGORIES_DISPLAY)
-        axes[idx].barh(range(len(value_counts)), value_counts.values)
-        axes[idx].set_yticks(range(len(value_counts)))
-        axes[idx].set_yticklabels(value_counts.index)
+    for idx, (col, labels, counts) in enumerate(top_values):
+        axes[idx].barh(range(len(counts)), counts)
+        axes[idx].set_yticks(range(len(counts)))
+        axes[idx].set_yticklabels(labels)
         axes[idx].set_title(f"Top Values in {col}")
         axes[idx].set_xlabel("Count")
         axes[idx].grid(True, alpha=0.3, axis="x")
@@ -318,9 +685,8 @@ def create_categorical_plots(
     for idx in range(n_cols, 4):
         axes[idx].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DEFAULT_DPI)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=DEFAULT_DPI)
 
     return [output_path]
 
@@ -330,88 +696,91 @@ def format_summary_report(
     quality: Dict,
     stats: Dict,
     corr: Optional[pd.DataFrame],
-    charts: List[str]
+    charts: List[str],
+    n_rows: Optional[int] = None
 ) -> str:
     """
     Format comprehensive analysis report.
 
     Args:
-        df: Original DataFrame
+        df: Original DataFrame (or a schema-only frame with n_rows)
         quality: Data quality analysis results
         stats: Statistical analysis results
         corr: Correlation matrix (if available)
         charts: List of created visualizations
+        n_rows: Row count, if df does not hold the rows (default:
+                len(df))
 
     Returns:
         Formatted report string
     """
-    summary = []
+    if n_rows is None:
+        n_rows = df.shape[0]
 
-    # Header
-    summary.append("=" * 60)
-    summary.append("📊 DATA OVERVIEW")
-    summary.append("=" * 60)
-    summary.append(
-        f"Rows: {df.shape[0]:,} | Columns: {df.shape[1]}"
-    )
-    summary.append(
-        f"\nColumns: {', '.join(df.columns.tolist())}"
+    buf = io.StringIO()
+    w = buf.write
+
+    # Per-column text is built once, in one join each
+    col_names = ", ".join(df.columns.tolist())
+    dtype_rows = "\n".join(
+        f"  • {col}: {dtype}" for col, dtype in df.dtypes.items()
     )
+    rule = "=" * 60
+
+    # Header
+    w(f"{rule}\n📊 DATA OVERVIEW\n{rule}\n")
+    w(f"Rows: {n_rows:,} | Columns: {df.shape[1]}\n")
+    w(f"\nColumns: {col_names}\n")
 
     # Data types
-    summary.append("\n📋 DATA TYPES:")
-    for col, dtype in df.dtypes.items():
-        summary.append(f"  • {col}: {dtype}")
+    w("\n📋 DATA TYPES:\n")
+    if dtype_rows:
+        w(f"{dtype_rows}\n")
 
     # Data quality
-    summary.append("\n🔍 DATA QUALITY:")
+    w("\n🔍 DATA QUALITY:\n")
     if quality["is_complete"]:
-        summary.append(
-            "✓ No missing values - dataset is complete!"
-        )
+        w("✓ No missing values - dataset is complete!\n")
     else:
-        summary.append(
+        w(
             f"Missing values: {quality['total_missing']:,} "
-            f"({quality['missing_percentage']:.2f}% of total data)"
+            f"({quality['missing_percentage']:.2f}% of total data)\n"
         )
-        summary.append("Missing by column:")
+        w("Missing by column:\n")
         for col, info in quality["missing_by_column"].items():
-            summary.append(
-                f"  • {col}: {info['count']:,} "
-                f"({info['percentage']:.1f}%)"
-            )
+            w(f"  • {col}: {info['count']:,} ({info['percentage']:.1f}%)\n")
 
     # Statistics
     if stats:
-        summary.append("\n📈 NUMERICAL ANALYSIS:")
+        w("\n📈 NUMERICAL ANALYSIS:\n")
         for col, col_stats in stats.items():
-            summary.append(f"\n{col}:")
-            summary.append(f"  • Mean: {col_stats['mean']}")
-            summary.append(f"  • Std Dev: {col_stats['std']}")
-            summary.append(
-                f"  • Range: {col_stats['min']} - {col_stats['max']}"
-            )
-            summary.append(f"  • Median: {col_stats['50%']}")
+            w(f"\n{col}:\n")
+            w(f"  • Mean: {col_stats['mean']}\n")
+            w(f"  • Std Dev: {col_stats['std']}\n")
+            w(f"  • Range: {col_stats['min']} - {col_stats['max']}\n")
+            if "50%" in col_stats:
+                w(f"  • Median: {col_stats['50%']}\n")
 
     # Correlations
     if corr is not None:
-        summary.append("\n🔗 CORRELATIONS:")
-        summary.append(str(corr))
+        w(f"\n🔗 CORRELATIONS:\n{corr}\n")
 
     # Visualizations
     if charts:
-        summary.append("\n📊 VISUALIZATIONS CREATED:")
+        w("\n📊 VISUALIZATIONS CREATED:\n")
         for chart in charts:
-            summary.append(f"  ✓ {Path(chart).name}")
+            w(f"  ✓ {Path(chart).name}\n")
 
-    summary.append("\n" + "=" * 60)
-    summary.append("✅ COMPREHENSIVE ANALYSIS COMPLETE")
-    summary.append("=" * 60)
+    w(f"\n{rule}\n✅ COMPREHENSIVE ANALYSIS COMPLETE\n{rule}")
 
-    return "\n".join(summary)
+    return buf.getvalue()
 
 
-def summarize_csv(file_path: str, output_dir: str = ".") -> str:
+def summarize_csv(
+    file_path: str,
+    output_dir: str = ".",
+    streaming: bool = False
+) -> str:
     """
     Generate comprehensive analysis of CSV file.
 
@@ -420,6 +789,9 @@ def summarize_csv(file_path: str, output_dir: str = ".") -> str:
     Args:
         file_path: Path to CSV file
         output_dir: Directory for output visualizations (default: ".")
+        streaming: Read the file in chunks and report only the overview,
+                   data quality and mean/std/min/max; correlations and
+                   visualizations need the full data and are skipped
 
     Returns:
         Formatted analysis report
@@ -428,35 +800,54 @@ def summarize_csv(file_path: str, output_dir: str = ".") -> str:
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV file is empty or malformed
     """
+    if streaming:
+        schema, n_rows, quality, stats = stream_csv_summary(file_path)
+        return format_summary_report(
+            schema, quality, stats, None, [], n_rows=n_rows
+        )
+
     # Load data
     df = load_csv(file_path)
 
     # Analyze data quality
     quality = analyze_data_quality(df)
 
+    # Classify columns once for every analysis step
+    columns = ColumnIndex.from_dataframe(df)
+
     # Compute statistics
-    stats = compute_statistics(df)
+    stats = compute_statistics(df, columns)
 
     # Analyze correlations
-    corr = analyze_correlations(df)
-
-    # Generate visualizations
-    charts = []
-
-    # Correlation heatmap
-    if corr is not None:
-        heatmap_path = f"{output_dir}/correlation_heatmap.png"
-        create_correlation_heatmap(corr, heatmap_path)
-        charts.append(heatmap_path)
-
-    # Time-series plots
-    charts.extend(create_time_series_plots(df, output_dir))
-
-    # Distribution plots
-    charts.extend(create_distribution_plots(df, output_dir))
+    corr = analyze_correlations(df, columns)
+
+    # Generate visualizations concurrently; each plot renders its own
+    # Figure, so no pyplot global state is shared between threads
+    with ThreadPoolExecutor(max_workers=MAX_PLOT_WORKERS) as executor:
+        # Correlation heatmap
+        heatmap_future = None
+        if corr is not None:
+            heatmap_path = f"{output_dir}/correlation_heatmap.png"
+            heatmap_future = executor.submit(
+                create_correlation_heatmap, corr, heatmap_path
+            )
 
-    # Categorical plots
-    charts.extend(create_categorical_plots(df, output_dir))
+        # Time-series, distribution and categorical plots
+        plot_futures = [
+            executor.submit(create_plots, df, output_dir, columns)
+            for create_plots in (
+                create_time_series_plots,
+                create_distribution_plots,
+                create_categorical_plots,
+            )
+        ]
+
+        charts = []
+        if heatmap_future is not None:
+            heatmap_future.result()
+            charts.append(heatmap_path)
+        for future in plot_futures:
+            charts.extend(future.result())
 
     # Format and return report
     return format_summary_report(df, quality, stats, corr, charts)
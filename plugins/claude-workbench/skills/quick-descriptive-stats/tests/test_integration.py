@@ -5,8 +5,15 @@ Tests the full summarize_csv orchestration.
 """
 
 import pytest
+import pandas as pd
 from pathlib import Path
-from analyze import summarize_csv
+from analyze import (
+    MAX_TIMESERIES_POINTS,
+    _downsample_timeseries,
+    create_categorical_plots,
+    create_time_series_plots,
+    summarize_csv
+)
 
 
 def test_summarize_csv_with_valid_sales_data(tmp_path):
@@ -59,3 +66,80 @@ def test_summarize_csv_with_numeric_only_data(tmp_path):
     # Should have correlation heatmap and distributions
     assert (tmp_path / "correlation_heatmap.png").exists()
     assert (tmp_path / "distributions.png").exists()
+
+
+def test_summarize_csv_streaming_skips_visualizations(tmp_path):
+    """
+    Verify streaming mode reports quality and statistics without charts.
+    """
+    fixture_path = Path(__file__).parent / "fixtures" / "valid_sales.csv"
+
+    report = summarize_csv(str(fixture_path), str(tmp_path), streaming=True)
+
+    assert "Rows: 10" in report
+    assert "DATA QUALITY" in report
+    assert "NUMERICAL ANALYSIS" in report
+    assert "VISUALIZATIONS CREATED" not in report
+    assert not list(tmp_path.iterdir())
+
+
+def test_categorical_plots_skip_near_unique_columns(tmp_path):
+    """
+    Verify free-text columns with mostly distinct values are not plotted.
+    """
+    df = pd.DataFrame({
+        "comment": [f"note {i}" for i in range(20)],
+        "status": ["open", "closed"] * 10
+    })
+
+    assert create_categorical_plots(df[["comment"]], str(tmp_path)) == []
+    assert create_categorical_plots(df, str(tmp_path)) == [
+        f"{tmp_path}/categorical_distributions.png"
+    ]
+
+
+def test_downsample_timeseries_sizes_bins_from_span():
+    """
+    Verify a dense single-day series keeps detail instead of one point.
+    """
+    index = pd.date_range("2024-01-01", periods=5000, freq="s")
+    frame = pd.DataFrame({"reading": range(5000)}, index=index)
+
+    binned = _downsample_timeseries(frame)
+
+    assert 1 < len(binned) <= MAX_TIMESERIES_POINTS
+    assert len(_downsample_timeseries(frame.iloc[:100])) == 100
+
+
+@pytest.mark.parametrize("unit", ["ns", "s"])
+def test_time_series_plots_render_long_hourly_series(tmp_path, unit):
+    """
+    Verify more than MAX_TIMESERIES_POINTS hourly rows still plot.
+    """
+    dates = pd.date_range("2024-01-01", periods=3000, freq="h")
+    df = pd.DataFrame({
+        "timestamp": dates.as_unit(unit),
+        "reading": range(3000)
+    })
+
+    assert create_time_series_plots(df, str(tmp_path)) == [
+        f"{tmp_path}/time_series_analysis.png"
+    ]
+
+
+def test_time_series_plots_render_long_series_from_csv(tmp_path):
+    """
+    Verify long series loaded from timestamp strings still plot.
+    """
+    csv_path = tmp_path / "hourly.csv"
+    pd.DataFrame({
+        "timestamp": pd.date_range(
+            "2024-01-01", periods=3000, freq="h"
+        ).strftime("%Y-%m-%d %H:%M:%S"),
+        "reading": range(3000)
+    }).to_csv(csv_path, index=False)
+
+    report = summarize_csv(str(csv_path), str(tmp_path))
+
+    assert "VISUALIZATIONS CREATED" in report
+    assert (tmp_path / "time_series_analysis.png").exists()
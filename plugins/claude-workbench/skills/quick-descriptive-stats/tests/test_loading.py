@@ -85,3 +85,36 @@ def test_load_csv_with_categorical_only():
     assert df.shape[0] == 6
     assert df.shape[1] == 3
     assert all(df.dtypes == "object")
+
+
+def test_load_csv_renames_duplicate_and_blank_headers(tmp_path):
+    """
+    Verify duplicate and blank headers are renamed like the C parser.
+    """
+    csv_path = tmp_path / "headers.csv"
+    csv_path.write_text(",a,a,b,name,name\n0,1,2,3,x,y\n1,4,5,6,z,w\n")
+
+    df = load_csv(str(csv_path))
+
+    assert list(df.columns) == list(pd.read_csv(csv_path).columns)
+    assert list(df.columns) == [
+        "Unnamed: 0", "a", "a.1", "b", "name", "name.1"
+    ]
+
+
+def test_load_csv_keeps_dates_as_strings(tmp_path):
+    """
+    Verify timestamp and date columns load as text, as with the C parser.
+    """
+    csv_path = tmp_path / "dates.csv"
+    csv_path.write_text(
+        "ts,day,value\n"
+        "2024-01-01 00:00:00,2024-01-05,1\n"
+        "2024-01-02 01:00:00,2024-01-06,2\n"
+    )
+
+    df = load_csv(str(csv_path))
+
+    assert df["ts"].tolist() == ["2024-01-01 00:00:00", "2024-01-02 01:00:00"]
+    assert df["day"].tolist() == ["2024-01-05", "2024-01-06"]
+    assert df["value"].tolist() == [1, 2]
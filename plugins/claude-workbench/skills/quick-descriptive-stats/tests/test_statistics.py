@@ -8,12 +8,36 @@ import pytest
 import pandas as pd
 from pathlib import Path
 from analyze import (
+    ColumnIndex,
     load_csv,
     compute_statistics,
-    analyze_correlations
+    analyze_correlations,
+    analyze_data_quality,
+    stream_csv_summary
 )
 
 
+def test_column_index_classifies_columns():
+    """
+    Verify ColumnIndex groups columns the same way select_dtypes does.
+    """
+    df = pd.DataFrame({
+        "count": [1, 2],
+        "price": [1.5, 2.5],
+        "flag": [True, False],
+        "name": ["a", "b"],
+        "when": pd.to_datetime(["2024-01-01", "2024-01-02"])
+    })
+
+    columns = ColumnIndex.from_dataframe(df)
+
+    assert columns.numeric == (
+        df.select_dtypes(include="number").columns.tolist()
+    )
+    assert columns.categorical == ["name"]
+    assert columns.datetime_like == ["when"]
+
+
 def test_compute_statistics_with_numeric_columns():
     """
     Verify statistics computation for numeric columns.
@@ -71,3 +95,47 @@ def test_analyze_correlations_with_single_numeric():
     corr = analyze_correlations(df)
 
     assert corr is None
+
+
+def test_analyze_correlations_matches_pandas():
+    """
+    Verify correlations match pandas with and without missing values.
+    """
+    df = pd.DataFrame({
+        "col_a": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "col_b": [2.0, 1.0, 4.0, 3.0, 6.0],
+        "col_c": [7.0, 7.0, 7.0, 7.0, 7.0]
+    })
+
+    pd.testing.assert_frame_equal(
+        analyze_correlations(df), df.corr()
+    )
+
+    df.loc[1, "col_b"] = None
+    pd.testing.assert_frame_equal(
+        analyze_correlations(df), df.corr()
+    )
+
+
+def test_stream_csv_summary_matches_full_load():
+    """
+    Verify chunked statistics and quality match a full in-memory load.
+    """
+    fixture_path = (
+        Path(__file__).parent / "fixtures" / "missing_values.csv"
+    )
+    df = load_csv(str(fixture_path))
+
+    schema, n_rows, quality, stats = stream_csv_summary(
+        str(fixture_path), chunksize=2
+    )
+
+    assert n_rows == len(df)
+    assert list(schema.columns) == list(df.columns)
+    assert quality == analyze_data_quality(df)
+
+    full_stats = compute_statistics(df)
+    assert stats.keys() == full_stats.keys()
+    for col, col_stats in stats.items():
+        for name in ("mean", "std", "min", "max"):
+            assert col_stats[name] == pytest.approx(full_stats[col][name])
@@ -9,13 +9,136 @@ This module provides functions for common Excel operations including:
 - Error handling
 """
 
+import functools
+import math
+import mmap
 import os
-from typing import Any
-
+import re
+import warnings
+import zipfile
+from collections import defaultdict
+from typing import Any, Iterable, Literal, Sequence
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
 import pandas as pd
+import pandas.api.types as ptypes
 from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font
-from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.workbook.child import INVALID_TITLE_REGEX
+
+try:
+    import lxml  # noqa: F401
+
+    _HAS_LXML = True
+except ImportError:
+    _HAS_LXML = False
+
+try:
+    import python_calamine  # noqa: F401
+
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+# Header style pandas applies in DataFrame.to_excel
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+_XLSXWRITER_HEADER_FORMAT = {
+    "bold": True,
+    "border": 1,
+    "align": "center",
+    "valign": "top",
+}
+
+# A1-style cell reference as openpyxl reads it: optional "$" anchors,
+# column letters in either case, then a row number from 1
+_CELL_RE = re.compile(r"^\$?([A-Za-z]{1,3})\$?([1-9]\d*)$")
+
+# Workbooks larger than this are memory-mapped rather than read()
+_MMAP_THRESHOLD = 32 * 1024 * 1024
+
+# Frames longer than this are streamed even without lxml
+_STREAMING_MIN_ROWS = 50_000
+
+# Fixed OOXML parts for write_dataframe_fast's single-sheet workbook
+_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_PREFIX = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+_CONTENT_TYPES_XML = (
+    _XML_DECL
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    f'<Override PartName="/xl/workbook.xml" '
+    f'ContentType="{_CT_PREFIX}.sheet.main+xml"/>'
+    f'<Override PartName="/xl/worksheets/sheet1.xml" '
+    f'ContentType="{_CT_PREFIX}.worksheet+xml"/>'
+    f'<Override PartName="/xl/styles.xml" '
+    f'ContentType="{_CT_PREFIX}.styles+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS_XML = (
+    _XML_DECL
+    + f'<Relationships xmlns="{_NS_PKG_REL}">'
+    f'<Relationship Id="rId1" Type="{_NS_REL}/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK_RELS_XML = (
+    _XML_DECL
+    + f'<Relationships xmlns="{_NS_PKG_REL}">'
+    f'<Relationship Id="rId1" Type="{_NS_REL}/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_NS_REL}/styles" '
+    'Target="styles.xml"/>'
+    "</Relationships>"
+)
+# Style 1 is the bold, bordered, centered header pandas writes
+_STYLES_XML = (
+    _XML_DECL
+    + f'<styleSheet xmlns="{_NS_MAIN}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    "</fonts>"
+    '<fills count="2">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    "</fills>"
+    '<borders count="2">'
+    "<border><left/><right/><top/><bottom/><diagonal/></border>"
+    '<border><left style="thin"/><right style="thin"/>'
+    '<top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    "</borders>"
+    '<cellStyleXfs count="1">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+    "</cellStyleXfs>"
+    '<cellXfs count="2">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" '
+    'applyFont="1" applyBorder="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="top"/></xf>'
+    "</cellXfs>"
+    '<cellStyles count="1">'
+    '<cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles>"
+    "</styleSheet>"
+)
+_FAST_WRITE_BATCH_ROWS = 10_000
 
 
 class ExcelOperationError(Exception):
@@ -24,12 +147,28 @@ class ExcelOperationError(Exception):
     pass
 
 
-def create_workbook(file_path: str) -> Workbook:
+def create_workbook(
+    file_path: str, save: bool = True, write_only: bool = False
+) -> Workbook:
     """
     Create a new Excel workbook and save it.
 
+    Callers that populate the workbook and save it themselves should
+    pass save=False; the initial save only writes an empty workbook
+    that is overwritten later.
+
+    With write_only=True the workbook streams rows to disk with
+    near-constant memory. It starts without sheets: add one with
+    wb.create_sheet(), append rows, then call wb.save(file_path) once.
+    Because a write-only workbook can only be saved a single time, it
+    is never saved here.
+
     Args:
         file_path: Path where the workbook will be saved
+        save: Save the empty workbook to file_path (default: True;
+              ignored when write_only is True)
+        write_only: Create a write-only (streaming) workbook
+                    (default: False)
 
     Returns:
         Workbook object
@@ -38,8 +177,9 @@ def create_workbook(file_path: str) -> Workbook:
         ExcelOperationError: If workbook cannot be created
     """
     try:
-        wb = Workbook()
-        wb.save(file_path)
+        wb = Workbook(write_only=write_only)
+        if save and not write_only:
+            wb.save(file_path)
         return wb
     except Exception as e:
         raise ExcelOperationError(
@@ -47,15 +187,81 @@ def create_workbook(file_path: str) -> Workbook:
         )
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_read(
+    realpath: str,
+    mtime_ns: int,
+    size: int,
+    sheet_name: str | int | tuple[str | int, ...] | None,
+) -> pd.DataFrame | dict[str | int, pd.DataFrame]:
+    """Parse a sheet once per (path, mtime, size, sheet) and reuse it."""
+    # Lists of sheets arrive as hashable tuples; pandas wants a list
+    if isinstance(sheet_name, tuple):
+        sheet_name = list(sheet_name)
+    engine = _read_engine(realpath)
+    if size <= _MMAP_THRESHOLD:
+        return pd.read_excel(realpath, sheet_name=sheet_name, engine=engine)
+
+    mm = _mmap_open(realpath)
+    try:
+        return pd.read_excel(mm, sheet_name=sheet_name, engine=engine)
+    finally:
+        mm.close()
+
+
+def _read_engine(path: str) -> str | None:
+    """
+    Pick the fastest installed pandas engine for a workbook.
+
+    python-calamine (Rust) parses every Excel format; without it .xlsb
+    needs pyxlsb and anything else is left to pandas' default.
+    """
+    if _HAS_CALAMINE:
+        return "calamine"
+    if os.path.splitext(path)[1].lower() == ".xlsb":
+        return "pyxlsb"
+    return None
+
+
+class _SeekableMmap(mmap.mmap):
+    """mmap with the seekable() method zipfile expects of file objects."""
+
+    def seekable(self) -> bool:
+        return True
+
+
+def _mmap_open(path: str) -> _SeekableMmap:
+    """Map a file read-only so the OS pages in ZIP members on demand."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return _SeekableMmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
 def read_excel(
-    file_path: str, sheet_name: str | int = 0
-) -> pd.DataFrame:
+    file_path: str,
+    sheet_name: str | int | list[str | int] | None = 0,
+    streaming: bool = False,
+) -> pd.DataFrame | dict[str | int, pd.DataFrame]:
     """
     Read an Excel file into a pandas DataFrame.
 
+    Parsed sheets are cached by path, modification time, size and sheet,
+    so re-reading an unchanged workbook skips the unzip and XML parse.
+    Workbooks over 32MB are memory-mapped instead of read into memory.
+    When python-calamine is installed it is used as the parser, which
+    is several times faster than openpyxl; .xlsb files otherwise use
+    pyxlsb.
+    Each call returns a copy, so callers may modify the result freely.
+    Use read_excel.cache_clear() to drop cached sheets.
+
     Args:
         file_path: Path to the Excel file
-        sheet_name: Sheet name or index to read (default: first sheet)
+        sheet_name: Sheet name or index to read (default: first sheet);
+                    a list of them or None returns a dict of DataFrames
+        streaming: Read through a read-only workbook with near-constant
+                   parser memory (see read_excel_streaming)
 
     Returns:
         DataFrame containing the data
@@ -63,18 +269,248 @@ def read_excel(
     Raises:
         ExcelOperationError: If file cannot be read
     """
-    if not os.path.exists(file_path):
+    if streaming:
+        return read_excel_streaming(file_path, sheet_name=sheet_name)
+
+    if isinstance(sheet_name, list):
+        sheet_name = tuple(sheet_name)
+
+    try:
+        stat = os.stat(file_path)
+        df = _cached_read(
+            os.path.realpath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            sheet_name,
+        )
+    except FileNotFoundError:
+        raise ExcelOperationError(
+            f"Excel file not found: {file_path}"
+        )
+    except Exception as e:
+        raise ExcelOperationError(
+            f"Failed to read Excel file: {str(e)}"
+        )
+
+    # sheet_name=None returns every sheet as a dict of DataFrames
+    if isinstance(df, dict):
+        return {name: sheet.copy() for name, sheet in df.items()}
+    return df.copy()
+
+
+read_excel.cache_clear = _cached_read.cache_clear
+
+
+def read_excel_streaming(
+    file_path: str,
+    sheet_name: str | int = 0,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read a sheet through a read-only openpyxl workbook.
+
+    Rows are parsed lazily from the worksheet XML instead of building a
+    full in-memory workbook, which keeps parser memory near-constant on
+    large files. The first row is used as the header and cached formula
+    results are returned instead of formulas.
+
+    Args:
+        file_path: Path to the Excel file
+        sheet_name: Sheet name or index to read (default: first sheet)
+        columns: Header names to keep (default: all columns)
+
+    Returns:
+        DataFrame containing the data
+
+    Raises:
+        ExcelOperationError: If file, sheet or columns cannot be read
+    """
+    try:
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+    except FileNotFoundError:
         raise ExcelOperationError(
             f"Excel file not found: {file_path}"
         )
+    except Exception as e:
+        raise ExcelOperationError(
+            f"Failed to read Excel file: {str(e)}"
+        )
 
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
-        return df
+        if isinstance(sheet_name, int):
+            ws = wb.worksheets[sheet_name]
+        else:
+            ws = wb[sheet_name]
+
+        # Some writers omit <dimension> or store a bogus A1:A1 one; rescan
+        # the sheet and pad its ragged rows to a common width
+        if ws.max_row is None or ws.max_column is None or (
+            ws.max_row == 1 and ws.max_column == 1
+        ):
+            ws.reset_dimensions()
+            scanned = list(ws.values)
+            width = max(map(len, scanned), default=0)
+            rows = iter(
+                [row + (None,) * (width - len(row)) for row in scanned]
+            )
+        else:
+            rows = ws.values
+
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        if columns is None:
+            return pd.DataFrame.from_records(rows, columns=header)
+
+        missing = [col for col in columns if col not in header]
+        if missing:
+            raise ExcelOperationError(
+                f"Columns not found in sheet: "
+                f"{', '.join(map(str, missing))}"
+            )
+
+        positions = [header.index(col) for col in columns]
+        return pd.DataFrame.from_records(
+            ([row[i] for i in positions] for row in rows),
+            columns=list(columns),
+        )
+    except ExcelOperationError:
+        raise
     except Exception as e:
         raise ExcelOperationError(
             f"Failed to read Excel file: {str(e)}"
         )
+    finally:
+        wb.close()
+
+
+def _header_cell(ws: Any, value: Any) -> WriteOnlyCell:
+    """Create a write-only header cell styled like pandas' headers."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = _HEADER_FONT
+    cell.border = _HEADER_BORDER
+    cell.alignment = _HEADER_ALIGNMENT
+    return cell
+
+
+def _excel_value(value: Any) -> Any:
+    """
+    Convert a DataFrame cell the way pandas' Excel writer does.
+
+    Missing values become blank cells, NumPy booleans and numbers
+    their Python equivalents, infinities the strings "inf" and "-inf"
+    (pandas' default inf_rep) and non-scalars such as lists their
+    str() form.
+    """
+    if not ptypes.is_scalar(value):
+        return str(value)
+    if pd.isna(value):
+        return None
+    if isinstance(value, (np.bool_, np.integer, np.floating)):
+        value = value.item()
+    if ptypes.is_float(value) and math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return value
+
+
+def write_dataframe_streaming(
+    df: pd.DataFrame,
+    file_path: str,
+    sheet_name: str = "Sheet1",
+    index: bool = False,
+) -> None:
+    """
+    Stream a DataFrame row by row into a write-only workbook.
+
+    Rows are generated lazily and flushed as they are appended, so peak
+    memory stays around one row instead of a second copy of the frame.
+    Header and index cells are styled, missing values left blank and
+    infinities written as "inf"/"-inf", as pandas does.
+    write_dataframe uses this automatically for flat frames when lxml
+    is installed or the frame is large.
+
+    Args:
+        df: DataFrame to write (flat index and columns)
+        file_path: Path where the file will be saved
+        sheet_name: Name of the sheet (default: "Sheet1")
+        index: Whether to write DataFrame index (default: False)
+
+    Raises:
+        ExcelOperationError: If write fails
+    """
+    try:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+
+        header = list(df.columns)
+        if index:
+            header.insert(0, df.index.name)
+        ws.append([
+            None if value is None else _header_cell(ws, value)
+            for value in header
+        ])
+
+        for row in df.itertuples(index=index, name=None):
+            cells = [_excel_value(value) for value in row]
+            if index and cells[0] is not None:
+                cells[0] = _header_cell(ws, cells[0])
+            ws.append(cells)
+
+        wb.save(file_path)
+    except Exception as e:
+        raise ExcelOperationError(
+            f"Failed to write DataFrame: {str(e)}"
+        )
+
+
+def _write_dataframe_constant_memory(
+    df: pd.DataFrame,
+    file_path: str,
+    sheet_name: str,
+    index: bool,
+) -> None:
+    """
+    Write a DataFrame with xlsxwriter in constant_memory mode.
+
+    constant_memory flushes each row once the next one starts, so cells
+    must be written strictly row by row. pandas' writer emits body cells
+    column by column and would silently drop data, so rows are written
+    here directly instead, with values converted as pandas would.
+    """
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(
+        file_path,
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+        },
+    )
+    try:
+        ws = wb.add_worksheet(sheet_name)
+        header_format = wb.add_format(_XLSXWRITER_HEADER_FORMAT)
+
+        header = list(df.columns)
+        if index:
+            header.insert(0, df.index.name)
+        for col, value in enumerate(header):
+            if value is not None:
+                ws.write(0, col, value, header_format)
+
+        start = 1 if index else 0
+        for row_idx, row in enumerate(
+            df.itertuples(index=index, name=None), 1
+        ):
+            if index:
+                ws.write(row_idx, 0, _excel_value(row[0]), header_format)
+            ws.write_row(
+                row_idx,
+                start,
+                [_excel_value(value) for value in row[start:]],
+            )
+    finally:
+        wb.close()
 
 
 def write_dataframe(
@@ -82,46 +518,326 @@ def write_dataframe(
     file_path: str,
     sheet_name: str = "Sheet1",
     index: bool = False,
+    engine: Literal["openpyxl", "xlsxwriter"] = "openpyxl",
+    low_memory: bool = False,
 ) -> None:
     """
     Write a DataFrame to an Excel file.
 
+    With the openpyxl engine, rows are streamed into a write-only
+    workbook (see write_dataframe_streaming) when lxml is installed or
+    the frame has more than 50,000 rows, keeping memory near-constant
+    instead of building every cell in memory. The xlsxwriter engine
+    (requires the xlsxwriter package) is usually faster on large
+    frames; with low_memory=True it also runs in constant_memory mode,
+    writing rows strictly top to bottom. DataFrames with MultiIndex
+    rows or columns always use pandas' writer.
+
     Args:
         df: DataFrame to write
         file_path: Path where the file will be saved
         sheet_name: Name of the sheet (default: "Sheet1")
         index: Whether to write DataFrame index (default: False)
+        engine: "openpyxl" or "xlsxwriter" (default: "openpyxl")
+        low_memory: Use xlsxwriter's constant_memory mode (xlsxwriter
+                    engine only; default: False)
 
     Raises:
-        ExcelOperationError: If write fails
+        ExcelOperationError: If engine is unknown or write fails
+    """
+    if engine not in ("openpyxl", "xlsxwriter"):
+        raise ExcelOperationError(
+            f"Invalid engine '{engine}'. Must be one of: "
+            f"openpyxl, xlsxwriter"
+        )
+
+    flat = df.columns.nlevels == 1 and df.index.nlevels == 1
+
+    try:
+        if engine == "xlsxwriter":
+            if low_memory and flat:
+                _write_dataframe_constant_memory(
+                    df, file_path, sheet_name, index
+                )
+            else:
+                with pd.ExcelWriter(file_path, engine="xlsxwriter") as w:
+                    df.to_excel(w, sheet_name=sheet_name, index=index)
+        elif flat and (_HAS_LXML or len(df) > _STREAMING_MIN_ROWS):
+            write_dataframe_streaming(df, file_path, sheet_name, index)
+        else:
+            if not _HAS_LXML:
+                warnings.warn(
+                    "install lxml for faster/low-mem xlsx writes"
+                )
+            df.to_excel(file_path, sheet_name=sheet_name, index=index)
+    except ExcelOperationError:
+        raise
+    except Exception as e:
+        raise ExcelOperationError(
+            f"Failed to write DataFrame: {str(e)}"
+        )
+
+
+def _fast_column_kind(series: pd.Series) -> str | None:
+    """
+    Classify a column for write_dataframe_fast.
+
+    Returns "b" (boolean), "n" (number) or "s" (text), or None when the
+    column holds values the direct writer does not serialize, such as
+    dates, infinities or mixed objects.
+    """
+    if ptypes.is_bool_dtype(series.dtype):
+        return "b"
+    if ptypes.is_numeric_dtype(series.dtype) and not (
+        ptypes.is_complex_dtype(series.dtype)
+    ):
+        if ptypes.is_float_dtype(series.dtype) and series.isin(
+            [float("inf"), float("-inf")]
+        ).any():
+            return None
+        return "n"
+    if ptypes.is_object_dtype(series.dtype) or ptypes.is_string_dtype(
+        series.dtype
+    ):
+        if ptypes.infer_dtype(series, skipna=True) not in (
+            "string",
+            "empty",
+        ):
+            return None
+        if series.str.contains(ILLEGAL_CHARACTERS_RE, na=False).any():
+            return None
+        return "s"
+    return None
+
+
+def _inline_str(ref: str, value: str, style: str = "") -> str:
+    """Format a text cell as an inline string."""
+    return (
+        f'<c r="{ref}"{style} t="inlineStr"><is>'
+        f'<t xml:space="preserve">{escape(value)}</t></is></c>'
+    )
+
+
+def _fast_cells(
+    letter: str,
+    kind: str,
+    values: np.ndarray,
+    missing: np.ndarray,
+    rows: list[str],
+) -> list[str]:
+    """
+    Serialize one column slice into cell XML, "" for missing values.
+
+    Values are converted to text a whole column at a time (ints by
+    NumPy, floats by repr, which is faster than NumPy's float-to-string
+    kernel and round-trips exactly), then wrapped in one comprehension.
+    """
+    opening = f'<c r="{letter}'
+    if kind == "s":
+        text = [escape(value) for value in values.tolist()]
+        middle = '" t="inlineStr"><is><t xml:space="preserve">'
+        closing = "</t></is></c>"
+    else:
+        if kind == "b":
+            text = values.astype(np.int8).astype(str).tolist()
+        elif values.dtype.kind == "f":
+            text = list(map(repr, values.tolist()))
+        else:
+            text = values.astype(str).tolist()
+        middle = '" t="b"><v>' if kind == "b" else '"><v>'
+        closing = "</v></c>"
+
+    cells = [
+        f"{opening}{r}{middle}{t}{closing}" for r, t in zip(rows, text)
+    ]
+    if missing.any():
+        for pos in np.flatnonzero(missing).tolist():
+            cells[pos] = ""
+    return cells
+
+
+def write_dataframe_fast(
+    df: pd.DataFrame, file_path: str, sheet_name: str = "Sheet1"
+) -> None:
+    """
+    Write a DataFrame by generating the sheet XML directly.
+
+    Skips openpyxl's per-cell objects entirely: the workbook skeleton is
+    a set of fixed parts and each row is formatted straight into a
+    streamed ZIP member, with text stored as inline strings. Only frames
+    of numbers, booleans and text are written this way; anything else
+    (dates, infinities, mixed objects, MultiIndex columns, XML-illegal
+    control characters in headers or text) falls back to
+    write_dataframe. The index is not written.
+
+    Unlike write_dataframe, text starting with "=" is stored as a
+    literal string, not as a formula.
+
+    Args:
+        df: DataFrame to write
+        file_path: Path where the file will be saved
+        sheet_name: Name of the sheet (default: "Sheet1"; at most 31
+                    characters, none of []:*?/\\)
+
+    Raises:
+        ExcelOperationError: If the sheet name is invalid or write fails
     """
+    if len(sheet_name) > 31 or INVALID_TITLE_REGEX.search(sheet_name):
+        raise ExcelOperationError(
+            f"Invalid sheet name '{sheet_name}': must be at most 31 "
+            f"characters and contain none of []:*?/\\"
+        )
+
+    kinds = [_fast_column_kind(df[col]) for col in df.columns]
+    illegal_header = any(
+        ILLEGAL_CHARACTERS_RE.search(str(name)) for name in df.columns
+    )
+    if df.columns.nlevels != 1 or None in kinds or illegal_header:
+        write_dataframe(df, file_path, sheet_name=sheet_name)
+        return
+
+    letters = [get_column_letter(j) for j in range(1, len(kinds) + 1)]
+    missing = [df[col].isna().to_numpy() for col in df.columns]
+    # Missing slots hold a placeholder; _fast_cells blanks them out
+    values = [
+        df[col].fillna("").to_numpy(dtype=object)
+        if kind == "s"
+        else df[col].fillna(False if kind == "b" else 0).to_numpy()
+        for col, kind in zip(df.columns, kinds)
+    ]
+    row_numbers = np.arange(2, len(df) + 2).astype(str).tolist()
+
+    workbook_xml = (
+        _XML_DECL
+        + f'<workbook xmlns="{_NS_MAIN}" xmlns:r="{_NS_REL}"><sheets>'
+        f'<sheet name={quoteattr(sheet_name)} sheetId="1" r:id="rId1"/>'
+        "</sheets></workbook>"
+    )
+    last_ref = f"{letters[-1]}{len(df) + 1}" if letters else "A1"
+
     try:
-        df.to_excel(file_path, sheet_name=sheet_name, index=index)
+        with zipfile.ZipFile(
+            file_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zf:
+            zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+            zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+            zf.writestr("xl/workbook.xml", workbook_xml)
+            zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+            zf.writestr("xl/styles.xml", _STYLES_XML)
+
+            with zf.open(
+                "xl/worksheets/sheet1.xml", "w", force_zip64=True
+            ) as sheet:
+                header = "".join(
+                    _inline_str(f"{letter}1", str(name), ' s="1"')
+                    for letter, name in zip(letters, df.columns)
+                )
+                sheet.write(
+                    (
+                        _XML_DECL
+                        + f'<worksheet xmlns="{_NS_MAIN}">'
+                        f'<dimension ref="A1:{last_ref}"/><sheetData>'
+                        f'<row r="1">{header}</row>'
+                    ).encode()
+                )
+
+                for start in range(0, len(df), _FAST_WRITE_BATCH_ROWS):
+                    stop = start + _FAST_WRITE_BATCH_ROWS
+                    rows = row_numbers[start:stop]
+                    columns = [
+                        _fast_cells(
+                            letter, kind, vals[start:stop],
+                            miss[start:stop], rows,
+                        )
+                        for letter, kind, vals, miss in zip(
+                            letters, kinds, values, missing
+                        )
+                    ]
+                    sheet.write(
+                        "".join(
+                            f'<row r="{r}">{"".join(cells)}</row>'
+                            for r, cells in zip(rows, zip(*columns))
+                        ).encode()
+                    )
+                sheet.write(b"</sheetData></worksheet>")
     except Exception as e:
         raise ExcelOperationError(
             f"Failed to write DataFrame: {str(e)}"
         )
 
 
+def _parse_cell(cell: str) -> tuple[int, int] | None:
+    """Parse "B2", "b2" or "$B$2" into (row, column), or None."""
+    match = _CELL_RE.match(cell)
+    if match is None:
+        return None
+    letters, row = match.groups()
+    return int(row), column_index_from_string(letters.upper())
+
+
 def add_formula(ws: Any, cell: str, formula: str) -> None:
     """
     Add a formula to a cell in a worksheet.
 
     Args:
         ws: Worksheet object from openpyxl
-        cell: Cell reference (e.g., "A1")
+        cell: Cell reference (e.g., "A1", "a1" or "$A$1")
         formula: Excel formula (must start with "=")
 
     Raises:
-        ExcelOperationError: If cell reference is invalid
+        ExcelOperationError: If cell reference or formula is invalid
     """
-    try:
-        ws[cell] = formula
-    except Exception as e:
+    add_formulas(ws, cell, [formula])
+
+
+def add_formulas(
+    ws: Any,
+    anchor: str,
+    formulas: Sequence[str],
+    direction: Literal["down", "right"] = "down",
+) -> None:
+    """
+    Write a run of formulas starting at an anchor cell.
+
+    The anchor is parsed once and each formula goes to the next row
+    (or column) by integer offset, so filling a column of formulas
+    does not re-parse a cell reference per formula.
+
+    Args:
+        ws: Worksheet object from openpyxl
+        anchor: Cell reference of the first formula (e.g., "C2")
+        formulas: Excel formulas (each must start with "=")
+        direction: "down" fills rows below the anchor, "right" fills
+                   columns to its right
+
+    Raises:
+        ExcelOperationError: If the anchor, direction or any formula is
+                             invalid (nothing is written)
+    """
+    if direction not in ("down", "right"):
         raise ExcelOperationError(
-            f"Failed to add formula to {cell}: invalid cell reference"
+            f"Invalid direction '{direction}'. Must be 'down' or 'right'"
         )
 
+    if not all(isinstance(f, str) and f.startswith("=") for f in formulas):
+        raise ExcelOperationError(
+            "Failed to add formulas: every formula must start with '='"
+        )
+
+    coords = _parse_cell(anchor)
+    if coords is None:
+        raise ExcelOperationError(
+            f"Failed to add formula to {anchor}: invalid cell reference"
+        )
+
+    row, col = coords
+    if direction == "down":
+        for offset, formula in enumerate(formulas):
+            ws.cell(row=row + offset, column=col).value = formula
+    else:
+        for offset, formula in enumerate(formulas):
+            ws.cell(row=row, column=col + offset).value = formula
+
 
 # Financial model color standards (RGB values from SKILL.md)
 FINANCIAL_COLORS = {
@@ -132,6 +848,13 @@ FINANCIAL_COLORS = {
     "yellow_bg": "00FFFF00",  # Key assumptions (background)
 }
 
+# One shared Font per standard color, so styling a cell allocates nothing
+FINANCIAL_FONTS = {
+    name: Font(color=rgb) for name, rgb in FINANCIAL_COLORS.items()
+}
+_VALID_COLORS = frozenset(FINANCIAL_COLORS)
+_VALID_COLORS_MSG = ", ".join(FINANCIAL_COLORS)
+
 
 def set_cell_color(ws: Any, cell: str, color: str) -> None:
     """
@@ -139,22 +862,50 @@ def set_cell_color(ws: Any, cell: str, color: str) -> None:
 
     Args:
         ws: Worksheet object from openpyxl
-        cell: Cell reference (e.g., "A1")
+        cell: Cell reference (e.g., "A1", "a1" or "$A$1")
         color: Color name ("blue", "black", "green", "red")
 
     Raises:
-        ExcelOperationError: If color is invalid
+        ExcelOperationError: If color or cell reference is invalid
     """
-    if color not in FINANCIAL_COLORS:
-        raise ExcelOperationError(
-            f"Invalid color '{color}'. Must be one of: "
-            f"{', '.join(FINANCIAL_COLORS.keys())}"
-        )
+    set_cell_colors(ws, [(cell, color)])
 
-    try:
-        rgb = FINANCIAL_COLORS[color]
-        ws[cell].font = Font(color=rgb)
-    except Exception as e:
+
+def set_cell_colors(
+    ws: Any, assignments: Iterable[tuple[str, str]]
+) -> None:
+    """
+    Set font colors for many cells per financial model standards.
+
+    Cells are grouped by color and written through ws.cell(), so each
+    reference is parsed once and every cell shares one Font object.
+
+    Args:
+        ws: Worksheet object from openpyxl
+        assignments: (cell reference, color name) pairs,
+                     e.g. [("B1", "blue"), ("B2", "black")]
+
+    Raises:
+        ExcelOperationError: If any color or cell reference is invalid
+                             (nothing is written)
+    """
+    groups = defaultdict(list)
+    for cell, color in assignments:
+        coords = _parse_cell(cell)
+        if coords is None:
+            raise ExcelOperationError(
+                f"Failed to set color for {cell}: invalid cell reference"
+            )
+        groups[color].append(coords)
+
+    invalid = groups.keys() - _VALID_COLORS
+    if invalid:
         raise ExcelOperationError(
-            f"Failed to set color for {cell}: {str(e)}"
+            f"Invalid color '{sorted(invalid)[0]}'. Must be one of: "
+            f"{_VALID_COLORS_MSG}"
         )
+
+    for color, cells in groups.items():
+        font = FINANCIAL_FONTS[color]
+        for row, col in cells:
+            ws.cell(row=row, column=col).font = font
@@ -1,19 +1,31 @@
+import importlib.util
 import os
+import re
+import shutil
 import sys
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
+from openpyxl import Workbook, load_workbook
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import xlsx_operations
 from xlsx_operations import (
     create_workbook,
     read_excel,
+    read_excel_streaming,
     write_dataframe,
+    write_dataframe_fast,
+    write_dataframe_streaming,
     add_formula,
+    add_formulas,
     set_cell_color,
+    set_cell_colors,
     ExcelOperationError,
 )
 
@@ -21,16 +33,24 @@ from xlsx_operations import (
 class TestXLSXBasicOperations(unittest.TestCase):
     """Test basic Excel operations."""
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every test in the class."""
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root."""
+        shutil.rmtree(cls._root, ignore_errors=True)
 
-    def tearDown(self):
-        """Clean up test fixtures after each test method."""
-        import shutil
+    def setUp(self):
+        """Give each test its own subdirectory of the shared root."""
+        self.test_dir = os.path.join(self._root, self._testMethodName)
+        os.makedirs(self.test_dir)
 
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    def _new_worksheet(self):
+        """Return the active sheet of a fresh in-memory workbook."""
+        return Workbook().active
 
     def test_create_workbook_success(self):
         """Test creating a new workbook."""
@@ -40,6 +60,30 @@ class TestXLSXBasicOperations(unittest.TestCase):
         self.assertIsNotNone(wb)
         self.assertTrue(os.path.exists(output_path))
 
+    def test_create_workbook_without_save(self):
+        """Test creating a workbook without the initial save."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        wb = create_workbook(output_path, save=False)
+
+        self.assertIsNotNone(wb.active)
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_create_workbook_write_only(self):
+        """Test creating a streaming workbook and saving it once."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        wb = create_workbook(output_path, write_only=True)
+
+        self.assertTrue(wb.write_only)
+        self.assertFalse(os.path.exists(output_path))
+
+        ws = wb.create_sheet("Data")
+        ws.append(["A", "B"])
+        ws.append([1, 2])
+        wb.save(output_path)
+
+        result_df = read_excel(output_path, sheet_name="Data")
+        self.assertEqual(list(result_df.columns), ["A", "B"])
+
     def test_read_excel_success(self):
         """Test reading an Excel file."""
         output_path = os.path.join(self.test_dir, "test.xlsx")
@@ -53,12 +97,132 @@ class TestXLSXBasicOperations(unittest.TestCase):
         self.assertEqual(len(result_df), 3)
         self.assertEqual(list(result_df.columns), ["A", "B"])
 
+    def test_read_excel_cached_copy(self):
+        """Test repeated reads reuse the parse but return fresh copies."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        pd.DataFrame({"A": [1, 2, 3]}).to_excel(output_path, index=False)
+
+        with mock.patch.object(
+            xlsx_operations.pd, "read_excel", wraps=pd.read_excel
+        ) as parse:
+            first = read_excel(output_path)
+            first.loc[0, "A"] = 100
+            second = read_excel(output_path)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(second.loc[0, "A"], 1)
+
+    def test_read_excel_sheet_list(self):
+        """Test reading a list of sheets returns a dict of copies."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        with pd.ExcelWriter(output_path) as writer:
+            pd.DataFrame({"A": [1]}).to_excel(
+                writer, sheet_name="One", index=False
+            )
+            pd.DataFrame({"B": [2]}).to_excel(
+                writer, sheet_name="Two", index=False
+            )
+
+        sheets = read_excel(output_path, sheet_name=["One", 1])
+        self.assertEqual(set(sheets), {"One", 1})
+        sheets["One"].loc[0, "A"] = 100
+
+        again = read_excel(output_path, sheet_name=["One", 1])
+        self.assertEqual(again["One"].loc[0, "A"], 1)
+        self.assertEqual(list(again[1]["B"]), [2])
+
+    def test_read_excel_memory_mapped(self):
+        """Test large workbooks are read through a memory map."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+        df.to_excel(output_path, index=False)
+
+        with mock.patch.object(xlsx_operations, "_MMAP_THRESHOLD", 0):
+            result_df = read_excel(output_path)
+        pd.testing.assert_frame_equal(result_df, df)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("python_calamine"),
+        "python-calamine not installed",
+    )
+    def test_read_excel_uses_calamine(self):
+        """Test the calamine engine is picked when it is installed."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "z"]})
+        df.to_excel(output_path, index=False)
+
+        with mock.patch.object(
+            xlsx_operations.pd, "read_excel", wraps=pd.read_excel
+        ) as parse:
+            result_df = read_excel(output_path)
+
+        self.assertEqual(parse.call_args.kwargs["engine"], "calamine")
+        pd.testing.assert_frame_equal(result_df, df)
+
+    def test_read_engine_without_calamine(self):
+        """Test .xlsb falls back to pyxlsb and .xlsx to pandas' default."""
+        with mock.patch.object(xlsx_operations, "_HAS_CALAMINE", False):
+            self.assertEqual(
+                xlsx_operations._read_engine("book.XLSB"), "pyxlsb"
+            )
+            self.assertIsNone(xlsx_operations._read_engine("book.xlsx"))
+
+    def test_read_excel_streaming(self):
+        """Test reading through a read-only workbook."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+
+        df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+        df.to_excel(output_path, index=False)
+
+        result_df = read_excel(output_path, streaming=True)
+        pd.testing.assert_frame_equal(result_df, df)
+
+        subset_df = read_excel_streaming(output_path, columns=["B"])
+        self.assertEqual(list(subset_df.columns), ["B"])
+        self.assertEqual(list(subset_df["B"]), [4, 5, 6])
+
+    def test_read_excel_streaming_without_dimension(self):
+        """Test streaming a sheet whose <dimension> element is missing."""
+        source_path = os.path.join(self.test_dir, "source.xlsx")
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+
+        df = pd.DataFrame({"A": [1, 2, 3], "B": ["x", None, "z"]})
+        df.to_excel(source_path, index=False)
+
+        sheet = "xl/worksheets/sheet1.xml"
+        with zipfile.ZipFile(source_path) as src, zipfile.ZipFile(
+            output_path, "w"
+        ) as dst:
+            for item in src.infolist():
+                data = src.read(item)
+                if item.filename == sheet:
+                    data = re.sub(rb"<dimension[^>]*/>", b"", data)
+                dst.writestr(item, data)
+
+        result_df = read_excel_streaming(output_path)
+        self.assertEqual(list(result_df.columns), ["A", "B"])
+        self.assertEqual(list(result_df["A"]), [1, 2, 3])
+        self.assertIsNone(result_df["B"][1])
+
+    def test_read_excel_streaming_missing_column(self):
+        """Test streaming read of an unknown column raises error."""
+        output_path = os.path.join(self.test_dir, "test.xlsx")
+        pd.DataFrame({"A": [1]}).to_excel(output_path, index=False)
+
+        with self.assertRaises(ExcelOperationError) as context:
+            read_excel_streaming(output_path, columns=["Z"])
+        self.assertIn("not found", str(context.exception).lower())
+
     def test_read_excel_file_not_found(self):
         """Test reading a non-existent Excel file."""
         with self.assertRaises(ExcelOperationError) as context:
             read_excel("nonexistent.xlsx")
         self.assertIn("not found", str(context.exception).lower())
 
+        with self.assertRaises(ExcelOperationError) as context:
+            read_excel("nonexistent.xlsx", streaming=True)
+        self.assertIn("not found", str(context.exception).lower())
+
     def test_write_dataframe_success(self):
         """Test writing a DataFrame to Excel."""
         output_path = os.path.join(self.test_dir, "output.xlsx")
@@ -75,18 +239,230 @@ class TestXLSXBasicOperations(unittest.TestCase):
 
         self.assertTrue(os.path.exists(output_path))
 
+        wb = load_workbook(output_path, read_only=True)
+        rows = list(wb.active.values)
+        wb.close()
+        self.assertEqual(rows[0], ("Name", "Age", "Salary"))
+        self.assertEqual(len(rows) - 1, 2)
+
+    def test_write_dataframe_missing_values_and_index(self):
+        """Test writing missing values and the index round-trips."""
+        output_path = os.path.join(self.test_dir, "output.xlsx")
+
+        df = pd.DataFrame(
+            {"Score": [1.5, None, 3.0]},
+            index=pd.Index(["a", "b", "c"], name="Key"),
+        )
+
+        write_dataframe(df, output_path, index=True)
+
+        result_df = read_excel(output_path)
+        self.assertEqual(list(result_df.columns), ["Key", "Score"])
+        self.assertEqual(list(result_df["Key"]), ["a", "b", "c"])
+        self.assertTrue(pd.isna(result_df["Score"][1]))
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("xlsxwriter"), "xlsxwriter not installed"
+    )
+    def test_write_dataframe_xlsxwriter_engine(self):
+        """Test writing with xlsxwriter, with and without low_memory."""
+        df = pd.DataFrame(
+            {
+                "Name": ["Alice", "Bob", None],
+                "Age": [25, 30, 35],
+                "Ratio": [0.5, float("inf"), float("-inf")],
+            },
+            index=pd.Index(["a", "b", "c"], name="Key"),
+        )
+
+        for index in (False, True):
+            results = []
+            for low_memory in (False, True):
+                output_path = os.path.join(
+                    self.test_dir, f"xlsxwriter_{index}_{low_memory}.xlsx"
+                )
+                write_dataframe(
+                    df,
+                    output_path,
+                    index=index,
+                    engine="xlsxwriter",
+                    low_memory=low_memory,
+                )
+
+                result_df = read_excel(output_path)
+                self.assertEqual(list(result_df["Age"]), [25, 30, 35])
+                self.assertTrue(pd.isna(result_df["Name"][2]))
+                if index:
+                    ws = load_workbook(output_path).active
+                    self.assertTrue(ws["A2"].font.b)
+                results.append(result_df)
+
+            pd.testing.assert_frame_equal(results[0], results[1])
+
+    def test_write_dataframe_nullable_boolean(self):
+        """Test nullable booleans are written as TRUE/FALSE cells."""
+        df = pd.DataFrame(
+            {"Flag": pd.array([True, False, None], dtype="boolean")}
+        )
+        writers = [(write_dataframe_streaming, {})]
+        if importlib.util.find_spec("xlsxwriter"):
+            writers.append(
+                (write_dataframe, {"engine": "xlsxwriter", "low_memory": True})
+            )
+
+        for writer, kwargs in writers:
+            output_path = os.path.join(self.test_dir, "flags.xlsx")
+            writer(df, output_path, **kwargs)
+
+            ws = load_workbook(output_path).active
+            self.assertEqual(
+                [ws[f"A{r}"].value for r in (2, 3, 4)],
+                [True, False, None],
+            )
+            self.assertEqual(ws["A2"].data_type, "b")
+
+    def test_write_dataframe_invalid_engine(self):
+        """Test writing with an unknown engine raises error."""
+        output_path = os.path.join(self.test_dir, "output.xlsx")
+        df = pd.DataFrame({"A": [1]})
+
+        with self.assertRaises(ExcelOperationError) as context:
+            write_dataframe(df, output_path, engine="odf")
+        self.assertIn("invalid", str(context.exception).lower())
+
+    def test_write_dataframe_without_lxml_warns(self):
+        """Test the pandas fallback is used and flagged without lxml."""
+        output_path = os.path.join(self.test_dir, "output.xlsx")
+        df = pd.DataFrame({"A": [1, 2]})
+
+        with mock.patch.object(xlsx_operations, "_HAS_LXML", False):
+            with self.assertWarns(UserWarning):
+                write_dataframe(df, output_path)
+
+        self.assertEqual(len(read_excel(output_path)), 2)
+
+    def test_write_dataframe_large_frame_streams_without_lxml(self):
+        """Test large frames are streamed even when lxml is missing."""
+        output_path = os.path.join(self.test_dir, "output.xlsx")
+        df = pd.DataFrame({"A": [1, 2, 3]})
+
+        with mock.patch.object(xlsx_operations, "_HAS_LXML", False):
+            with mock.patch.object(
+                xlsx_operations, "_STREAMING_MIN_ROWS", 2
+            ):
+                with mock.patch.object(
+                    xlsx_operations,
+                    "write_dataframe_streaming",
+                    wraps=write_dataframe_streaming,
+                ) as stream:
+                    write_dataframe(df, output_path)
+
+        stream.assert_called_once()
+        self.assertEqual(list(read_excel(output_path)["A"]), [1, 2, 3])
+
+    def test_write_dataframe_streaming_round_trip(self):
+        """Test streaming a DataFrame with missing values round-trips."""
+        output_path = os.path.join(self.test_dir, "stream.xlsx")
+        df = pd.DataFrame(
+            {"Name": ["Alice", None, "Cara"], "Score": [1.5, 2.0, None]}
+        )
+
+        write_dataframe_streaming(df, output_path, sheet_name="Data")
+
+        result_df = read_excel(output_path, sheet_name="Data")
+        self.assertEqual(list(result_df.columns), ["Name", "Score"])
+        self.assertTrue(pd.isna(result_df["Name"][1]))
+        self.assertTrue(pd.isna(result_df["Score"][2]))
+
+    def test_write_dataframe_streaming_matches_pandas_values(self):
+        """Test infinities, list cells and index styling match pandas."""
+        output_path = os.path.join(self.test_dir, "stream.xlsx")
+        df = pd.DataFrame(
+            {
+                "Value": [1.0, float("inf"), float("-inf")],
+                "Items": [[1, 2], None, "x"],
+            },
+            index=pd.Index(["a", "b", "c"], name="Key"),
+        )
+
+        write_dataframe_streaming(df, output_path, index=True)
+
+        wb = load_workbook(output_path)
+        ws = wb.active
+        self.assertEqual(
+            [ws.cell(row=r, column=2).value for r in (2, 3, 4)],
+            [1, "inf", "-inf"],
+        )
+        self.assertEqual(ws["C2"].value, "[1, 2]")
+
+        pandas_path = os.path.join(self.test_dir, "pandas.xlsx")
+        df.to_excel(pandas_path)
+        pd.testing.assert_frame_equal(
+            read_excel(output_path), read_excel(pandas_path)
+        )
+        self.assertTrue(ws["A2"].font.b)
+        self.assertEqual(ws["A2"].border.left.style, "thin")
+        self.assertFalse(ws["B2"].font.b)
+
+    def test_write_dataframe_fast_round_trip(self):
+        """Test the direct-XML writer round-trips 100k rows."""
+        output_path = os.path.join(self.test_dir, "fast.xlsx")
+        n_rows = 100_000
+
+        df = pd.DataFrame(
+            {
+                "Id": range(n_rows),
+                "Score": [i / 4 for i in range(n_rows)],
+                "Label": [f"<row & {i}>" for i in range(n_rows)],
+                "Flag": [i % 2 == 0 for i in range(n_rows)],
+            }
+        )
+        df.loc[1, "Score"] = None
+        df.loc[2, "Label"] = float("nan")
+
+        write_dataframe_fast(df, output_path, sheet_name="Data")
+
+        result_df = read_excel(output_path, sheet_name="Data")
+        pd.testing.assert_frame_equal(result_df, df)
+
+    def test_write_dataframe_fast_invalid_sheet_name(self):
+        """Test sheet names Excel rejects raise instead of corrupting."""
+        output_path = os.path.join(self.test_dir, "fast.xlsx")
+        df = pd.DataFrame({"A": [1]})
+
+        for name in ("a/b", "x" * 32):
+            with self.assertRaises(ExcelOperationError) as context:
+                write_dataframe_fast(df, output_path, sheet_name=name)
+            self.assertIn("invalid sheet name", str(context.exception).lower())
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_write_dataframe_fast_illegal_header_falls_back(self):
+        """Test headers with control characters use write_dataframe."""
+        output_path = os.path.join(self.test_dir, "fast.xlsx")
+        df = pd.DataFrame({"a\x01": [1]})
+
+        with mock.patch.object(
+            xlsx_operations, "write_dataframe"
+        ) as fallback:
+            write_dataframe_fast(df, output_path)
+
+        fallback.assert_called_once()
+
+    def test_write_dataframe_fast_falls_back_for_dates(self):
+        """Test columns the direct writer cannot encode use pandas."""
+        output_path = os.path.join(self.test_dir, "fast.xlsx")
+        df = pd.DataFrame({"When": pd.to_datetime(["2024-01-31"])})
+
+        write_dataframe_fast(df, output_path)
+
         result_df = read_excel(output_path)
-        self.assertEqual(len(result_df), 2)
-        self.assertEqual(list(result_df.columns), ["Name", "Age", "Salary"])
+        self.assertEqual(result_df["When"][0], pd.Timestamp("2024-01-31"))
 
     def test_add_formula_success(self):
         """Test adding a formula to a workbook."""
         output_path = os.path.join(self.test_dir, "formula.xlsx")
 
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
         ws["A1"] = 10
         ws["A2"] = 20
 
@@ -94,26 +470,60 @@ class TestXLSXBasicOperations(unittest.TestCase):
 
         self.assertEqual(ws["A3"].value, "=SUM(A1:A2)")
 
-        wb.save(output_path)
-        wb.close()
+        ws.parent.save(output_path)
+
+    def test_add_formula_accepts_openpyxl_references(self):
+        """Test lowercase and $-anchored references are accepted."""
+        ws = self._new_worksheet()
+
+        add_formula(ws, "b2", "=1+1")
+        add_formula(ws, "$C$3", "=2+2")
+        set_cell_color(ws, "$b$2", "blue")
+
+        self.assertEqual(ws["B2"].value, "=1+1")
+        self.assertEqual(ws["C3"].value, "=2+2")
+        self.assertEqual(ws["B2"].font.color.rgb, "000000FF")
 
     def test_add_formula_invalid_cell(self):
         """Test adding formula to invalid cell reference."""
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
 
         with self.assertRaises(ExcelOperationError) as context:
             add_formula(ws, "INVALID", "=SUM(A1:A2)")
         self.assertIn("invalid", str(context.exception).lower())
 
+    def test_add_formulas_down_and_right(self):
+        """Test writing a run of formulas from an anchor cell."""
+        ws = self._new_worksheet()
+
+        add_formulas(ws, "C2", ["=A2+B2", "=A3+B3"])
+        add_formulas(ws, "B5", ["=SUM(B2:B3)", "=SUM(C2:C3)"], "right")
+
+        self.assertEqual(ws["C2"].value, "=A2+B2")
+        self.assertEqual(ws["C3"].value, "=A3+B3")
+        self.assertEqual(ws["B5"].value, "=SUM(B2:B3)")
+        self.assertEqual(ws["C5"].value, "=SUM(C2:C3)")
+
+    def test_add_formulas_rejects_non_formula(self):
+        """Test a value without a leading '=' is rejected up front."""
+        ws = self._new_worksheet()
+
+        with self.assertRaises(ExcelOperationError):
+            add_formulas(ws, "A1", ["=1+1", "2+2"])
+        self.assertIsNone(ws["A1"].value)
+
+    def test_add_formula_rejects_non_string(self):
+        """Test non-string formulas raise ExcelOperationError."""
+        ws = self._new_worksheet()
+
+        for formula in (5, None):
+            with self.assertRaises(ExcelOperationError):
+                add_formula(ws, "A1", formula)
+        self.assertIsNone(ws["A1"].value)
+
     def test_set_cell_color_blue(self):
         """Test setting cell color to blue (for inputs)."""
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
         ws["A1"] = 100
 
         set_cell_color(ws, "A1", "blue")
@@ -122,10 +532,7 @@ class TestXLSXBasicOperations(unittest.TestCase):
 
     def test_set_cell_color_black(self):
         """Test setting cell color to black (for formulas)."""
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
         ws["A1"] = "=SUM(B1:B10)"
 
         set_cell_color(ws, "A1", "black")
@@ -134,10 +541,7 @@ class TestXLSXBasicOperations(unittest.TestCase):
 
     def test_set_cell_color_green(self):
         """Test setting cell color to green (for links)."""
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
         ws["A1"] = "=Sheet2!A1"
 
         set_cell_color(ws, "A1", "green")
@@ -146,29 +550,60 @@ class TestXLSXBasicOperations(unittest.TestCase):
 
     def test_set_cell_color_invalid_color(self):
         """Test setting invalid color raises error."""
-        from openpyxl import Workbook
-
-        wb = Workbook()
-        ws = wb.active
+        ws = self._new_worksheet()
 
         with self.assertRaises(ExcelOperationError) as context:
             set_cell_color(ws, "A1", "purple")
         self.assertIn("invalid", str(context.exception).lower())
 
+    def test_set_cell_color_invalid_cell(self):
+        """Test setting color on an invalid cell reference raises error."""
+        ws = self._new_worksheet()
+
+        with self.assertRaises(ExcelOperationError) as context:
+            set_cell_color(ws, "A0", "blue")
+        self.assertIn("invalid cell reference", str(context.exception))
+
+    def test_set_cell_colors_bulk(self):
+        """Test coloring many cells in one call shares fonts."""
+        ws = self._new_worksheet()
+
+        set_cell_colors(
+            ws, [("A1", "blue"), ("B2", "black"), ("C3", "blue")]
+        )
+
+        self.assertEqual(ws["A1"].font.color.rgb, "000000FF")
+        self.assertEqual(ws["B2"].font.color.rgb, "00000000")
+        self.assertEqual(ws["C3"].font.color.rgb, "000000FF")
+
+    def test_set_cell_colors_invalid_color_writes_nothing(self):
+        """Test an invalid color in a batch is rejected up front."""
+        ws = self._new_worksheet()
+
+        with self.assertRaises(ExcelOperationError):
+            set_cell_colors(ws, [("A1", "blue"), ("A2", "purple")])
+        self.assertNotEqual(
+            ws["A1"].font, xlsx_operations.FINANCIAL_FONTS["blue"]
+        )
+
 
 class TestXLSXPandasIntegration(unittest.TestCase):
     """Test pandas integration for data analysis."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every test in the class."""
+        cls._root = tempfile.mkdtemp()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root."""
+        shutil.rmtree(cls._root, ignore_errors=True)
 
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+    def setUp(self):
+        """Give each test its own subdirectory of the shared root."""
+        self.test_dir = os.path.join(self._root, self._testMethodName)
+        os.makedirs(self.test_dir)
 
     def test_read_multiple_sheets(self):
         """Test reading multiple sheets from Excel."""
@@ -181,9 +616,9 @@ class TestXLSXPandasIntegration(unittest.TestCase):
             df1.to_excel(writer, sheet_name="Sheet1", index=False)
             df2.to_excel(writer, sheet_name="Sheet2", index=False)
 
-        sheets = pd.read_excel(
-            output_path, sheet_name=None
-        )
+        wb = load_workbook(output_path, read_only=True)
+        sheets = wb.sheetnames
+        wb.close()
 
         self.assertEqual(len(sheets), 2)
         self.assertIn("Sheet1", sheets)